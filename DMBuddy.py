@@ -1,26 +1,50 @@
 # DMBuddy.py
+import argparse
+from src.utils.startup import StartupProfiler
+
+profiler = StartupProfiler()  # Started before any other application import
+
 from src.utils.json_cache import JSONCache
 from src.utils.logger import setup_logger
-from src.gui.main_window import MainWindow
-import tkinter as tk
 from typing import List, Optional
 
 
-def main():
-    jcache = JSONCache()
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="DM Buddy")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print import and initialization timings once the window is ready.")
+    args = parser.parse_args(argv)
+    profiler.enabled = args.profile_startup
+
     config_file = "data/config/config.json"
-    jcache.read(config_file)
-    log = setup_logger(__name__, jcache)
+    with profiler.phase("config"):
+        jcache = JSONCache(config_file)  # Reads config.json once
+        log = setup_logger(__name__, jcache)
     if not config_file in jcache.list_cached_files():
         log.error(f"Configuration file {config_file} not found in cache.")
     log.info("Starting DM Buddy application")
 
     data_path = "data/config/GUI/main_menu.json"
 
-    root = tk.Tk() # Create the main application window
-    app = MainWindow(root, jcache, data_path)
+    # Show a splash right away and build the real window once Tk is idle.
+    tk = profiler.load("tkinter")
+    with profiler.phase("splash"):
+        root = tk.Tk() # Create the main application window
+        root.title("DM Buddy")
+        splash = tk.Label(root, text="Loading DM Buddy...", padx=40, pady=40)
+        splash.pack()
+        root.update_idletasks()
+
+    def build():
+        main_window = profiler.load("src.gui.main_window")
+        with profiler.phase("main window"):
+            splash.destroy()
+            root.app = main_window.MainWindow(root, jcache, data_path)
+        root.after_idle(profiler.finish)
+
+    root.after_idle(build)
     root.mainloop()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,24 +1,39 @@
 # DMBuddy/main.py
-from src.core.mediator import Mediator
-from src.gui.app_gui import AppGUI
+import argparse
+from src.utils.startup import StartupProfiler
+
+profiler = StartupProfiler()  # Started before any other application import
+
 from src.utils.injector import Injector
 from src.utils.logger import setup_logger
-from src.core.config import ConfigLoader
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DM Buddy")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print import and initialization timings once the window is ready.")
+    args = parser.parse_args(argv)
+    profiler.enabled = args.profile_startup
+
     # Setup logging
-    logger = setup_logger()
+    logger = setup_logger(__name__)
 
     try:
-        # Initialize dependency injector
+        # Initialize dependency injector and build background dependencies while the window appears
         injector = Injector()
+        injector.warm_up()
         
         # Load and validate configurations
-        config_loader = injector.get(ConfigLoader)
+        with profiler.phase("config"):
+            config_loader = injector.get("ConfigLoader")
         
         # Initialize mediator and GUI
-        mediator = injector.get(Mediator)
-        gui = injector.get(AppGUI)
+        with profiler.phase("mediator"):
+            mediator = injector.get("Mediator")
+        with profiler.phase("gui"):
+            gui = injector.get("AppGUI")
+        gui.root.after_idle(profiler.finish)
+        if args.profile_startup:
+            gui.root.after_idle(lambda: print(injector.timing_report()))
         
         # Start the application
         gui.run()
@@ -27,4 +42,4 @@ def main():
         raise
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
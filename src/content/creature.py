@@ -3,12 +3,21 @@ import json
 from src.utils.logger import setup_logger
 import os
 from typing import Dict, List, Optional, Set
-from content.item import Item
-from effect import Effect
+from src.content.item import Item
+from src.content.inventory import Inventory, ROOT
+from src.content.derived import DerivedStats
+from src.content.effect import Effect
 from src.core.session import dice_instance as dice
 
 log = setup_logger("DMTools")
 
+SKILL_ABILITIES = {"acrobatics": "dexterity", "animal handling": "wisdom", "arcana": "intelligence",
+                   "athletics": "strength", "deception": "charisma", "history": "intelligence",
+                   "insight": "wisdom", "intimidation": "charisma", "investigation": "intelligence",
+                   "medicine": "wisdom", "nature": "intelligence", "perception": "wisdom",
+                   "performance": "charisma", "persuasion": "charisma", "religion": "intelligence",
+                   "sleight of hand": "dexterity", "stealth": "dexterity", "survival": "wisdom"}
+
 class Creature(metaclass=ABCMeta):
     """Base class for a D&D 5e creature, handling core attributes and mechanics."""
 
@@ -132,6 +141,49 @@ class Creature(metaclass=ABCMeta):
         self.current_hp: int = self.max_hp
         self.temp_hp: int = 0
 
+        log.info("Validating creature ability scores, saves, skills, senses and speed.")
+        valid_abilities = rules.get("abilities", ["strength", "dexterity", "constitution",
+                                                 "intelligence", "wisdom", "charisma"])
+        stats_data = species_data.get("stats", {})
+        self.stats: Dict[str, int] = {ability: stats_data.get(ability, 10) if
+                                      isinstance(stats_data.get(ability, 10), int) else 10
+                                      for ability in valid_abilities}
+        saves_data = species_data.get("saves", {})
+        self.saves: Dict[str, int] = {ability: saves_data.get(ability, 0) if
+                                      isinstance(saves_data.get(ability, 0), int) else 0
+                                      for ability in valid_abilities}
+        skill_abilities = rules.get("skill_abilities", SKILL_ABILITIES)
+        skills_data = species_data.get("skills", {})
+        self.skills: Dict[str, int] = {skill: skills_data.get(skill, 0) if
+                                       isinstance(skills_data.get(skill, 0), int) else 0
+                                       for skill in skill_abilities}
+        valid_senses = rules.get("senses", ["blindsight", "darkvision", "passive perception",
+                                           "tremorsense", "truesight"])
+        senses_data = species_data.get("senses", {})
+        self.senses: Dict[str, int] = {sense: senses_data.get(sense, 0) if
+                                       isinstance(senses_data.get(sense, 0), int) else 0
+                                       for sense in valid_senses}
+        valid_movement_types = rules.get("movement_types", ["burrow", "climb", "fly", "swim", "walk"])
+        movement_data = species_data.get("speed", {})
+        self.speed: Dict[str, int] = {mode: movement_data.get(mode, 0) if
+                                      isinstance(movement_data.get(mode, 0), int) else 0
+                                      for mode in valid_movement_types}
+        for field, data, valid in (("ability", stats_data, valid_abilities), ("save", saves_data, valid_abilities),
+                                   ("skill", skills_data, skill_abilities), ("sense", senses_data, valid_senses),
+                                   ("movement type", movement_data, valid_movement_types)):
+            for key in data:
+                if key not in valid:
+                    log.warning(f"Invalid {field} '{key}' for {self.species}, ignored.")
+                    self.warnings += 1
+        self._skill_abilities: Dict[str, str] = skill_abilities
+        log.info("Creature ability scores, saves, skills, senses and speed validation complete.")
+
+        # Dynamic state
+        self.inventory: Inventory = Inventory()
+        self.active_effects: Dict[int, Effect] = {}
+        self._effect_modifiers: Dict[str, Dict[int, int]] = {}  # Attribute -> {id(effect): value}
+        self.derived: DerivedStats = DerivedStats()
+
 
 
 
@@ -165,6 +217,140 @@ class Creature(metaclass=ABCMeta):
     def remove_effect(self, effect_id: str) -> Dict[str, any]:
         pass
 
+    def _encumbrance(self) -> float:
+        """Total weight carried, read from the inventory's cached totals."""
+        return self.inventory.total_weight
+
+    def take_item(self, item: Item, container_id: str = ROOT) -> str:
+        """Add an item to inventory, optionally straight into a container."""
+        if not self.inventory.add(item, container_id):
+            return f"{self.given_name} cannot take {item.given_name}."
+        return f"{self.given_name} takes {item.given_name}."
+
+    def drop_item(self, item_id: str) -> str:
+        """Drop an item, and anything inside it, from inventory."""
+        item = self.inventory.remove(item_id)
+        if item is None:
+            return f"{self.given_name} has no such item to drop."
+        return f"{self.given_name} drops {item.given_name}."
+
+    def _can_put_in_container(self, item_id: str, container_id: str) -> bool:
+        """Check for room in container"""
+        return self.inventory.can_put_in_container(item_id, container_id)
+
+    def transfer_item_to_container(self, item_id: str, container_id: str) -> str:
+        """Move an item to a container."""
+        item = self.inventory.get(item_id)
+        container = self.inventory.get(container_id)
+        if item is None or container is None or not self.inventory.move(item_id, container_id):
+            return f"{self.given_name} cannot move that item there."
+        return f"{self.given_name} puts {item.given_name} in {container.given_name}."
+
+    def remove_item_from_container(self, item_id: str) -> str:
+        """Take an item out of its container and carry it directly."""
+        item = self.inventory.get(item_id)
+        if item is None or not self.inventory.move(item_id, ROOT):
+            return f"{self.given_name} cannot take that item out."
+        return f"{self.given_name} takes out {item.given_name}."
+
+    # Derived statistics.  Each value is cached until one of the inputs it read changes.
+
+    def set_stat(self, ability: str, value: int) -> None:
+        """Change an ability score and invalidate everything derived from it."""
+        self.stats[ability] = value
+        self.derived.invalidate(("stats", ability))
+
+    def set_speed(self, mode: str, value: int) -> None:
+        """Change a movement speed and invalidate everything derived from it."""
+        self.speed[mode] = value
+        self.derived.invalidate(("speed", mode))
+
+    def set_save(self, ability: str, value: int) -> None:
+        """Change a saving throw bonus (e.g. on gaining proficiency) and invalidate everything derived from it."""
+        self.saves[ability] = value
+        self.derived.invalidate(("saves", ability))
+
+    def set_skill(self, skill: str, value: int) -> None:
+        """Change a skill bonus (e.g. on gaining proficiency) and invalidate everything derived from it."""
+        self.skills[skill] = value
+        self.derived.invalidate(("skills", skill))
+
+    def set_sense(self, sense: str, value: int) -> None:
+        """Change a sense and invalidate everything derived from it."""
+        self.senses[sense] = value
+        self.derived.invalidate(("senses", sense))
+
+    def set_base_ac(self, value: int) -> None:
+        """Change the base armor class (e.g. on donning or doffing armor) and invalidate the armor class."""
+        self.base_ac = value
+        self.derived.invalidate(("base_ac",))
+
+    def add_active_effect(self, effect: Effect) -> None:
+        """Track an effect applied to this creature.  Called by apply_effect."""
+        self.active_effects[id(effect)] = effect
+        details = effect.spec.details
+        if details.get("operation") == "add" and isinstance(details.get("value"), int):
+            attribute = details.get("attribute", "")
+            self._effect_modifiers.setdefault(attribute, {})[id(effect)] = details["value"]
+            self.derived.invalidate(("effects", attribute))
+
+    def remove_active_effect(self, effect: Effect) -> None:
+        """Stop tracking an effect.  Called by remove_effect."""
+        if self.active_effects.pop(id(effect), None) is None:
+            return
+        attribute = effect.spec.details.get("attribute", "")
+        if self._effect_modifiers.get(attribute, {}).pop(id(effect), None) is not None:
+            self.derived.invalidate(("effects", attribute))
+
+    def _effect_bonus(self, attribute: str) -> int:
+        self.derived.depends_on(("effects", attribute))
+        return sum(self._effect_modifiers.get(attribute, {}).values())
+
+    def ability_score(self, ability: str) -> int:
+        def compute():
+            self.derived.depends_on(("stats", ability))
+            return self.stats.get(ability, 10) + self._effect_bonus(ability)
+        return self.derived.get(("ability_score", ability), compute)
+
+    def ability_modifier(self, ability: str) -> int:
+        return self.derived.get(("ability_modifier", ability),
+                                lambda: (self.ability_score(ability) - 10) // 2)
+
+    def armor_class(self) -> int:
+        """Armor class.  Equipment contributes through the effects it grants."""
+        def compute():
+            self.derived.depends_on(("base_ac",))
+            return self.base_ac + self._effect_bonus("armor_class")
+        return self.derived.get(("armor_class",), compute)
+
+    def saving_throw(self, ability: str) -> int:
+        def compute():
+            self.derived.depends_on(("saves", ability))
+            return (self.ability_modifier(ability) + self.saves.get(ability, 0)
+                    + self._effect_bonus("saving_throws") + self._effect_bonus(f"{ability}_save"))
+        return self.derived.get(("saving_throw", ability), compute)
+
+    def calculate_skill_bonus(self, skill: str) -> int:
+        """Skill bonus: ability modifier plus listed skill bonus plus effects."""
+        def compute():
+            self.derived.depends_on(("skills", skill))
+            ability = self._skill_abilities.get(skill, "")
+            return self.ability_modifier(ability) + self.skills.get(skill, 0) + self._effect_bonus(skill)
+        return self.derived.get(("skill", skill), compute)
+
+    def passive_perception(self) -> int:
+        def compute():
+            self.derived.depends_on(("senses", "passive perception"))
+            listed = self.senses.get("passive perception", 0)
+            return listed if listed else 10 + self.calculate_skill_bonus("perception")
+        return self.derived.get(("passive_perception",), compute)
+
+    def current_speed(self, mode: str = "walk") -> int:
+        def compute():
+            self.derived.depends_on(("speed", mode))
+            return max(0, self.speed.get(mode, 0) + self._effect_bonus("speed"))
+        return self.derived.get(("current_speed", mode), compute)
+
     def __eq__(self, other):
         if not isinstance(other, Creature):
             return NotImplemented
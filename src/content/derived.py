@@ -0,0 +1,63 @@
+# src/content/derived.py
+from typing import Any, Callable, Dict, Hashable, List, Set
+
+class DerivedStats:
+    """
+    Memoized derived values (armor class, saves, skill bonuses, etc.) for one creature.
+
+    While a value is computed, every input it reads is recorded with depends_on.  Derived
+    values read through get are recorded as inputs too, so invalidating an ability score
+    also clears the saving throw and skill bonuses built on its modifier.  A cached value
+    is only recomputed after one of its recorded inputs is invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+        self._dependents: Dict[Hashable, Set[Hashable]] = {}  # Input -> derived values reading it
+        self._computing: List[Hashable] = []
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return a derived value, computing and caching it if needed.
+
+        Args:
+            key (Hashable):         Name of the derived value, e.g. ('save', 'dexterity').
+            compute (Callable):     Computes the value.  Should call depends_on for each input.
+        """
+        if self._computing:
+            self._dependents.setdefault(key, set()).add(self._computing[-1])
+        if key in self._values:
+            return self._values[key]
+        self._computing.append(key)
+        try:
+            value = compute()
+        finally:
+            self._computing.pop()
+        self._values[key] = value
+        return value
+
+    def depends_on(self, *inputs: Hashable) -> None:
+        """Record inputs of the derived value currently being computed."""
+        if not self._computing:
+            return
+        key = self._computing[-1]
+        for name in inputs:
+            self._dependents.setdefault(name, set()).add(key)
+
+    def invalidate(self, *inputs: Hashable) -> None:
+        """Clear every cached value that (directly or indirectly) depends on the inputs."""
+        stack = list(inputs)
+        while stack:
+            dependents = self._dependents.pop(stack.pop(), None)
+            if not dependents:
+                continue
+            for key in dependents:
+                self._values.pop(key, None)
+                stack.append(key)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._dependents.clear()
@@ -1,17 +1,27 @@
 #src/content/effect.py
 import json
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 from src.utils.logger import setup_logger
 from src.core.observer import Observer
 
 log = setup_logger("DMBuddy.effect")
 
-class Effect(Observer):
+_specs: Dict[str, "EffectSpec"] = {}  # Interned effect definitions, keyed by effect ID
+_inline_specs: Dict[str, "EffectSpec"] = {}  # Definitions without an ID, keyed by their content
+_specs_loaded = False
+
+
+class EffectSpec:
     """
-    Effect resulting from an action in D&D 5e.
+    Validated, read-only definition of an effect.  Compiled once per effect ID and shared
+    by every Effect instance that applies it.
     """
 
+    __slots__ = ("effect_id", "effect_type", "duration", "duration_value", "duration_trigger",
+                 "duration_trigger_source", "details")
+
     _rules_cache = None  # Class-level cache for effect_rules.json
 
     @classmethod
@@ -31,47 +41,182 @@ class Effect(Observer):
                 raise ValueError("Invalid JSON in effect_rules.json")
         return cls._rules_cache
 
-
-    def __init__(self, target: str, details: dict) -> None:
-        log.debug("Defining new effect.")
-        rules = Effect._load_rules
-        self.effect_type: str = details.get("effect_type", "")
+    def __init__(self, effect_id: str, details: dict) -> None:
+        log.debug(f"Compiling effect '{effect_id}'.")
+        rules = EffectSpec._load_rules()
+        set_field = super().__setattr__
+        set_field("effect_id", effect_id)
+        set_field("effect_type", details.get("effect_type", ""))
+        set_field("details", MappingProxyType(dict(details)))
 
         # Effect duration.  More like 'duration_type'.  If not provided or not in the full list in the rules file, it is defaulted to 'instant'
-        valid_duration: List[str] = rules.get("duration")
-        self.duration: str = details.get("duration", "missing")
-        if self.duration == "missing":
-            log.warning(f"New effect for '{self.effect_type} is missing a duration.  Defaulting to instant.")
-            self.duration = "instant"
-        if not self.duration in valid_duration:
-            log.warning(f"New effect for '{self.effect_type} has invalid duration '{self.duration}.  Defaulting to instant.")
-            self.duration = "instant"
-        
+        valid_duration: List[str] = rules.get("duration", [])
+        duration: str = details.get("duration", "missing")
+        if duration == "missing":
+            log.warning(f"Effect '{effect_id}' is missing a duration.  Defaulting to instant.")
+            duration = "instant"
+        if not duration in valid_duration:
+            log.warning(f"Effect '{effect_id}' has invalid duration '{duration}'.  Defaulting to instant.")
+            duration = "instant"
+        set_field("duration", duration)
+
         # Attributes (all required) associated with a turn-based duration.
-        if self.duration == "turn_based":
+        duration_value = 0
+        duration_trigger = ""
+        duration_trigger_source = ""
+        if duration == "turn_based":
             log.debug("Turn-based effect.")
 
             # Number of turns effect lasts
-            self.duration_value: int = details.get("duration_value", -1)
-            if self.duration_value == -1:
-                log.warning(f"New effect for '{self.effect_type} duration is turn-based, but is missing the number of turns.  Defaulting to 1.")
-                self.duration_value = 1
-            if self.duration_value < 0:
-                log.warning(f"New effect for '{self.effect_type} duration is turn-based, but the number of turns specified is less than 0.  Defaulting to 1.")
-                self.duration_value = 1
+            duration_value = details.get("duration_value", -1)
+            if duration_value == -1:
+                log.warning(f"Effect '{effect_id}' duration is turn-based, but is missing the number of turns.  Defaulting to 1.")
+                duration_value = 1
+            if duration_value < 0:
+                log.warning(f"Effect '{effect_id}' duration is turn-based, but the number of turns specified is less than 0.  Defaulting to 1.")
+                duration_value = 1
 
             # How/when the count of turns remaining is triggered.
             valid_trigger = rules.get("trigger", ["beginning_of_turn", "end_of_turn"])
-            self.duration_trigger: str = details.get("duration_trigger", "missing")
-            if self.duration_trigger == "missing":
-                log.warning(f"New effect for '{self.effect_type} is duration-based but is missing a duration trigger.  Defaulting to 'end_of_turn'.")
-                self.duration_trigger = "end_of_turn"
-            if self.duration_trigger not in valid_trigger:
-                log.warning(f"Invalid duration trigger '{self.duration_trigger}' for new turn-based effect '{self.effect_type}'.  Defaulting to 'end_of_turn'.")
-                self.duration_trigger = "end_of_turn"
-            
+            duration_trigger = details.get("duration_trigger", "missing")
+            if duration_trigger == "missing":
+                log.warning(f"Effect '{effect_id}' is duration-based but is missing a duration trigger.  Defaulting to 'end_of_turn'.")
+                duration_trigger = "end_of_turn"
+            if duration_trigger not in valid_trigger:
+                log.warning(f"Invalid duration trigger '{duration_trigger}' for turn-based effect '{effect_id}'.  Defaulting to 'end_of_turn'.")
+                duration_trigger = "end_of_turn"
+
             # What entity triggers the count of remaining turns to increment.
-            self.duration_trigger_source: str = details.get("duration_trigger_source", "missing")
-            if self.duration_trigger_source == "missing":
-                log.warning(f"New effect for '{self.effect_type} is duration-based but is missing a duration trigger source.  Defaulting to the target of the effect.")
-                self.duration_trigger_source = "effect_target"
+            duration_trigger_source = details.get("duration_trigger_source", "missing")
+            if duration_trigger_source == "missing":
+                log.warning(f"Effect '{effect_id}' is duration-based but is missing a duration trigger source.  Defaulting to the target of the effect.")
+                duration_trigger_source = "effect_target"
+
+        set_field("duration_value", duration_value)
+        set_field("duration_trigger", duration_trigger)
+        set_field("duration_trigger_source", duration_trigger_source)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"EffectSpec '{self.effect_id}' is read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"EffectSpec '{self.effect_id}' is read-only.")
+
+    def __repr__(self):
+        return f"EffectSpec: {self.effect_id} ({self.duration})."
+
+
+def _definition(details: dict) -> dict:
+    """Effect details without the instance's source, which isn't part of the definition."""
+    return {key: value for key, value in details.items() if key != "source"}
+
+
+def intern_effect_spec(effect_id: str, details: dict) -> EffectSpec:
+    """Compile an effect definition, or return the existing one with the same ID."""
+    details = _definition(details)
+    spec = _specs.get(effect_id)
+    if spec is None:
+        spec = EffectSpec(effect_id, details)
+        _specs[effect_id] = spec
+    elif details != spec.details:
+        log.warning(f"Effect '{effect_id}' is already defined with different details.  Keeping the first definition.")
+    return spec
+
+
+def intern_inline_spec(details: dict) -> EffectSpec:
+    """Compile an effect definition that has no ID, or return the one compiled from the same details."""
+    content = _definition(details)
+    key = json.dumps(content, sort_keys=True, default=str)
+    spec = _inline_specs.get(key)
+    if spec is None:
+        spec = EffectSpec(content.get("effect_type", ""), content)
+        _inline_specs[key] = spec
+    return spec
+
+
+def load_effect_specs(directory: str = "data/content/effects") -> Dict[str, EffectSpec]:
+    """
+    Compile every effect definition in a directory.  Each JSON file maps effect IDs to
+    effect details; *_template.json files document the format and are skipped.
+    Definitions that are already interned are not compiled again.
+    """
+    global _specs_loaded
+    for file_path in sorted(Path(directory).glob("*.json")):
+        if file_path.name.endswith("_template.json"):
+            continue
+        try:
+            with open(file_path, 'r') as f:
+                definitions = json.load(f)
+        except json.JSONDecodeError:
+            log.warning(f"Effect definitions in '{file_path}' not properly formatted.  Ignored.")
+            continue
+        for effect_id, details in definitions.items():
+            intern_effect_spec(effect_id, details)
+    _specs_loaded = True
+    log.info(f"{len(_specs)} effect definitions compiled.")
+    return _specs
+
+
+def get_effect_spec(effect_id: str) -> Optional[EffectSpec]:
+    """Look up an interned effect definition, compiling data/content/effects on first use."""
+    if not _specs_loaded:
+        load_effect_specs()
+    return _specs.get(effect_id)
+
+
+class Effect(Observer):
+    """
+    Effect resulting from an action in D&D 5e.  The definition is a shared EffectSpec;
+    an instance only records who it applies to and who caused it.
+    """
+
+    __slots__ = ("spec", "target", "source")
+
+    def __init__(self, target: str, details: Union[str, dict, EffectSpec], source: str = "") -> None:
+        """
+        Args:
+            target (str):       Creature the effect applies to.
+            details:            Effect ID of an interned definition, an EffectSpec, or a
+                                dictionary of effect details (interned by 'effect_id', or by
+                                content if it has none).
+            source (str):       Optional.  Creature that caused the effect.
+        """
+        if isinstance(details, EffectSpec):
+            spec = details
+        elif isinstance(details, str):
+            spec = get_effect_spec(details)
+            if spec is None:
+                raise ValueError(f"Unknown effect '{details}'.")
+        elif "effect_id" in details:
+            spec = intern_effect_spec(details["effect_id"], details)
+        else:
+            spec = intern_inline_spec(details)
+        if isinstance(details, dict):
+            source = details.get("source", source)
+
+        self.spec: EffectSpec = spec
+        self.target: str = target
+        self.source: str = source
+
+    @property
+    def effect_type(self) -> str:
+        return self.spec.effect_type
+
+    @property
+    def duration(self) -> str:
+        return self.spec.duration
+
+    @property
+    def duration_value(self) -> int:
+        return self.spec.duration_value
+
+    @property
+    def duration_trigger(self) -> str:
+        return self.spec.duration_trigger
+
+    @property
+    def duration_trigger_source(self) -> str:
+        return self.spec.duration_trigger_source
+
+    def __repr__(self):
+        return f"Effect: {self.spec.effect_id} on {self.target}."
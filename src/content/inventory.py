@@ -0,0 +1,205 @@
+# src/content/inventory.py
+from typing import Dict, List, Optional, Set
+from src.content.item import Item
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.inventory")
+
+ROOT = "inventory"  # Node ID for items carried directly (hands, worn, belt, etc.)
+
+
+class _Node:
+    """An item in the inventory tree, with cached totals for everything inside it."""
+
+    __slots__ = ("item", "parent", "children", "contents_weight", "contents_value", "contents_count")
+
+    def __init__(self, item: Optional[Item], parent: Optional[str]) -> None:
+        self.item = item
+        self.parent = parent
+        self.children: Set[str] = set()
+        self.contents_weight: float = 0.0
+        self.contents_value: int = 0
+        self.contents_count: int = 0
+
+    def carried_weight(self) -> float:
+        """Weight this node adds to its parent."""
+        if self.item.weightless_contents:
+            return self.item.weight
+        return self.item.weight + self.contents_weight
+
+
+class Inventory:
+    """
+    Tree of items and containers for a single creature.
+
+    Every container keeps running totals of the weight, value and number of items inside
+    it.  Adding, removing or moving an item only updates the containers between the item
+    and the top of the tree, so totals and encumbrance can be read without walking the
+    whole inventory.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, _Node] = {ROOT: _Node(None, None)}
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id != ROOT and item_id in self._nodes
+
+    def __len__(self) -> int:
+        return self._nodes[ROOT].contents_count
+
+    def get(self, item_id: str) -> Optional[Item]:
+        node = self._nodes.get(item_id)
+        return node.item if node else None
+
+    def container_of(self, item_id: str) -> Optional[str]:
+        """ID of the container holding an item, or ROOT if carried directly."""
+        node = self._nodes.get(item_id)
+        return node.parent if node else None
+
+    def contents(self, container_id: str = ROOT) -> List[Item]:
+        """Items directly inside a container."""
+        node = self._nodes.get(container_id)
+        if node is None:
+            return []
+        return [self._nodes[child].item for child in node.children]
+
+    @property
+    def total_weight(self) -> float:
+        return self._nodes[ROOT].contents_weight
+
+    @property
+    def total_value(self) -> int:
+        return self._nodes[ROOT].contents_value
+
+    def container_totals(self, container_id: str) -> Dict[str, float]:
+        """Cached totals for the contents of a container."""
+        node = self._nodes[container_id]
+        return {"weight": node.contents_weight, "value": node.contents_value, "count": node.contents_count}
+
+    def _propagate(self, start: Optional[str], weight: float, value: int, count: int) -> None:
+        """Add deltas to 'start' and each of its ancestors."""
+        node_id = start
+        while node_id is not None:
+            node = self._nodes[node_id]
+            node.contents_weight += weight
+            node.contents_value += value
+            node.contents_count += count
+            # Weight stops at containers whose contents are weightless.
+            if node.item is not None and node.item.weightless_contents:
+                weight = 0.0
+            node_id = node.parent
+
+    def _is_inside(self, node_id: str, ancestor_id: str) -> bool:
+        while node_id is not None:
+            if node_id == ancestor_id:
+                return True
+            node_id = self._nodes[node_id].parent
+        return False
+
+    def _contributions(self, start: Optional[str], weight: float) -> Dict[str, float]:
+        """Weight an item in 'start' adds to 'start' and each ancestor, as _propagate applies it."""
+        contributions = {}
+        node_id = start
+        while node_id is not None and weight:
+            node = self._nodes[node_id]
+            contributions[node_id] = weight
+            if node.item is not None and node.item.weightless_contents:
+                weight = 0.0
+            node_id = node.parent
+        return contributions
+
+    def _has_room(self, container_id: str, weight: float, leaving: Optional[str] = None) -> bool:
+        """
+        Check the capacity of a container and of every container around it for an item
+        weighing 'weight'.  'leaving' is the container the item is moved out of, whose
+        ancestors lose that weight.  O(depth): stops where the weight stops propagating.
+        """
+        removed = self._contributions(leaving, weight) if leaving is not None else {}
+        for node_id, added in self._contributions(container_id, weight).items():
+            node = self._nodes[node_id]
+            if node.item is not None and node.contents_weight + added - removed.get(node_id, 0.0) > node.item.capacity:
+                return False
+        return True
+
+    def can_put_in_container(self, item_id: str, container_id: str) -> bool:
+        """Check that the container exists, isn't inside the item, and it and the containers around it have room."""
+        container = self._nodes.get(container_id)
+        node = self._nodes.get(item_id)
+        if container is None or node is None or item_id == ROOT:
+            return False
+        if node.parent == container_id:
+            return True
+        if container_id != ROOT and (not container.item.is_container or self._is_inside(container_id, item_id)):
+            return False
+        return self._has_room(container_id, node.carried_weight(), leaving=node.parent)
+
+    def add(self, item: Item, container_id: str = ROOT) -> bool:
+        """Add a new item to the inventory, optionally directly into a container."""
+        if item.item_ID in self._nodes:
+            log.warning(f"Item '{item.given_name}' is already in the inventory.")
+            return False
+        container = self._nodes.get(container_id)
+        if container is None or (container_id != ROOT and not container.item.is_container):
+            log.warning(f"'{container_id}' is not a container in this inventory.  Item '{item.given_name}' not added.")
+            return False
+        if not self._has_room(container_id, item.weight):
+            log.warning(f"Not enough room in '{container.item.given_name}' for '{item.given_name}'.")
+            return False
+        self._nodes[item.item_ID] = _Node(item, container_id)
+        container.children.add(item.item_ID)
+        self._propagate(container_id, item.weight, item.value, 1)
+        return True
+
+    def remove(self, item_id: str) -> Optional[Item]:
+        """Remove an item, and everything inside it, from the inventory."""
+        if item_id not in self:
+            return None
+        node = self._nodes[item_id]
+        self._detach(item_id)
+        stack = [item_id]
+        while stack:
+            removed = self._nodes.pop(stack.pop())
+            stack.extend(removed.children)
+        return node.item
+
+    def move(self, item_id: str, container_id: str = ROOT) -> bool:
+        """Move an item (with its contents) to another container."""
+        if item_id not in self:
+            return False
+        if not self.can_put_in_container(item_id, container_id):
+            log.warning(f"Cannot move '{self._nodes[item_id].item.given_name}' into '{container_id}'.")
+            return False
+        self._detach(item_id)
+        node = self._nodes[item_id]
+        node.parent = container_id
+        self._nodes[container_id].children.add(item_id)
+        self._propagate(container_id, node.carried_weight(), node.item.value + node.contents_value,
+                        1 + node.contents_count)
+        return True
+
+    def _detach(self, item_id: str) -> None:
+        node = self._nodes[item_id]
+        self._nodes[node.parent].children.discard(item_id)
+        self._propagate(node.parent, -node.carried_weight(), -(node.item.value + node.contents_value),
+                        -(1 + node.contents_count))
+
+    def encumbrance(self, strength: int, variant: bool = False) -> str:
+        """
+        Encumbrance status based on the cached total weight.
+
+        Args:
+            strength (int):     Strength score of the carrying creature.
+            variant (bool):     Use the variant encumbrance rules (house rule).
+
+        Returns:
+            str:                'unencumbered', 'encumbered', 'heavily_encumbered' or 'over_capacity'.
+        """
+        weight = self._nodes[ROOT].contents_weight
+        if weight > strength * 15:
+            return "over_capacity"
+        if variant:
+            if weight > strength * 10:
+                return "heavily_encumbered"
+            if weight > strength * 5:
+                return "encumbered"
+        return "unencumbered"
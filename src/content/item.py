@@ -0,0 +1,47 @@
+# src/content/item.py
+import uuid
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.item")
+
+class Item:
+    """
+    Base class for a D&D 5e item.  Attributes follow data/content/items/item_template.json.
+    """
+
+    def __init__(self, details: dict) -> None:
+        # Unique per copy, so several copies of the same item can be tracked separately.
+        self.item_ID: str = uuid.uuid4().hex
+        self.name: str = details.get("name", "Unknown Item")
+        self.given_name: str = details.get("given_name", self.name)
+        self.description: str = details.get("description", "")
+        self.type: str = details.get("type", "gear")
+        self.inventory_slot: str = details.get("inventory_slot", "")
+
+        weight = details.get("weight", 0.0)
+        self.weight: float = float(weight) if isinstance(weight, (int, float)) and weight >= 0 else 0.0
+        if self.weight != weight:
+            log.warning(f"Invalid weight '{weight}' for item '{self.name}'.  Defaulting to {self.weight}.")
+
+        value = details.get("value", 0)
+        self.value: int = value if isinstance(value, int) and value >= 0 else 0
+        if self.value != value:
+            log.warning(f"Invalid value '{value}' for item '{self.name}'.  Defaulting to 0.")
+
+        # Containers.  A capacity of 0 means the item cannot hold other items.
+        capacity = details.get("capacity", 0.0)
+        self.capacity: float = float(capacity) if isinstance(capacity, (int, float)) and capacity >= 0 else 0.0
+        if self.capacity != capacity:
+            log.warning(f"Invalid capacity '{capacity}' for item '{self.name}'.  Defaulting to 0.")
+        # Contents don't add to the carried weight (e.g. Bag of Holding).
+        self.weightless_contents: bool = bool(details.get("weightless_contents", False))
+
+    @property
+    def is_container(self) -> bool:
+        return self.capacity > 0
+
+    def __repr__(self):
+        return f"Item: {self.given_name} ({self.item_ID})."
+
+    def __str__(self):
+        return self.given_name
@@ -0,0 +1,183 @@
+# src/content/map.py
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.map")
+
+FEET_PER_CELL = 5
+CONE_HALF_ANGLE = math.atan(0.5)  # A 5e cone is as wide as it is long at any distance
+
+# Terrain kinds, stored one byte per cell in Map.terrain.
+NORMAL, DIFFICULT, WATER, STEEP = range(4)
+
+
+class Map:
+    """
+    2D battle map of square cells with a uniform-grid spatial index over token positions.
+
+    Tokens are filed in square buckets of 'bucket_size' cells.  Range and area queries only
+    visit the buckets overlapping the query's bounding box, so their cost grows with the
+    area searched and the tokens found, not with every token on the map.  Moving a token
+    is O(1).
+
+    Cells are addressed by integer (x, y).  Area origins are points in cell units, so
+    (3.0, 4.0) is the corner shared by cells (2, 3), (3, 3), (2, 4) and (3, 4); a cell is in
+    an area if its center is.
+    """
+
+    def __init__(self, width: int, height: int, bucket_size: int = 8) -> None:
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._tokens: Dict[str, object] = {}  # Token ID -> creature or other game object
+        self._buckets: Dict[Tuple[int, int], Set[str]] = {}
+        # Terrain layers, one byte per cell (index y * width + x).
+        self.walls = bytearray(width * height)
+        self.darkness = bytearray(width * height)
+        self.terrain = bytearray(width * height)  # NORMAL, DIFFICULT, WATER or STEEP
+        self.version = 0  # Incremented on every wall, lighting or terrain change, for caches built on them
+        self.vision_version = 0  # Incremented on wall and lighting changes only, for line-of-sight caches
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self._positions
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def set_wall(self, x: int, y: int, blocked: bool = True) -> None:
+        """Mark a cell as blocking movement and sight (or clear it)."""
+        if self.in_bounds(x, y) and self.walls[y * self.width + x] != blocked:
+            self.walls[y * self.width + x] = blocked
+            self.version += 1
+            self.vision_version += 1
+
+    def is_wall(self, x: int, y: int) -> bool:
+        """Cells outside the map count as walls."""
+        return not self.in_bounds(x, y) or bool(self.walls[y * self.width + x])
+
+    def set_dark(self, x: int, y: int, dark: bool = True) -> None:
+        """Mark a cell as in darkness (or lit)."""
+        if self.in_bounds(x, y) and self.darkness[y * self.width + x] != dark:
+            self.darkness[y * self.width + x] = dark
+            self.version += 1
+            self.vision_version += 1
+
+    def set_terrain(self, x: int, y: int, kind: int = DIFFICULT) -> None:
+        """Set a cell's terrain kind."""
+        if self.in_bounds(x, y) and self.terrain[y * self.width + x] != kind:
+            self.terrain[y * self.width + x] = kind
+            self.version += 1
+
+    def _bucket(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.bucket_size, y // self.bucket_size
+
+    def place(self, token_id: str, x: int, y: int, token: object = None) -> bool:
+        """Put a token on the map (or move it, if already placed)."""
+        if not self.in_bounds(x, y):
+            log.warning(f"Cannot place '{token_id}' at ({x}, {y}): outside the map.")
+            return False
+        if token_id in self._positions:
+            return self.move(token_id, x, y)
+        self._positions[token_id] = (x, y)
+        self._tokens[token_id] = token
+        self._buckets.setdefault(self._bucket(x, y), set()).add(token_id)
+        return True
+
+    def move(self, token_id: str, x: int, y: int) -> bool:
+        """Move a placed token to a new cell."""
+        if token_id not in self._positions or not self.in_bounds(x, y):
+            return False
+        old_bucket = self._bucket(*self._positions[token_id])
+        new_bucket = self._bucket(x, y)
+        if old_bucket != new_bucket:
+            self._buckets[old_bucket].discard(token_id)
+            self._buckets.setdefault(new_bucket, set()).add(token_id)
+        self._positions[token_id] = (x, y)
+        return True
+
+    def remove(self, token_id: str) -> bool:
+        position = self._positions.pop(token_id, None)
+        if position is None:
+            return False
+        self._tokens.pop(token_id, None)
+        self._buckets[self._bucket(*position)].discard(token_id)
+        return True
+
+    def position(self, token_id: str) -> Optional[Tuple[int, int]]:
+        return self._positions.get(token_id)
+
+    def token(self, token_id: str) -> object:
+        return self._tokens.get(token_id)
+
+    def targets(self, token_ids: List[str]) -> List[object]:
+        """Game objects for a list of token IDs, e.g. to pass to resolve_area_effect."""
+        return [self._tokens[token_id] for token_id in token_ids if self._tokens.get(token_id) is not None]
+
+    def _candidates(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[Tuple[str, int, int]]:
+        """Tokens in the buckets overlapping a bounding box (in cell units)."""
+        size = self.bucket_size
+        low_x = max(0, int(math.floor(min_x)) // size)
+        low_y = max(0, int(math.floor(min_y)) // size)
+        high_x = min(self.width - 1, int(math.floor(max_x))) // size
+        high_y = min(self.height - 1, int(math.floor(max_y))) // size
+        for bucket_x in range(low_x, high_x + 1):
+            for bucket_y in range(low_y, high_y + 1):
+                for token_id in self._buckets.get((bucket_x, bucket_y), ()):
+                    x, y = self._positions[token_id]
+                    yield token_id, x, y
+
+    def tokens_within(self, x: int, y: int, range_ft: int) -> List[str]:
+        """Tokens within a range of a cell, measured on the grid (every square is 5 ft)."""
+        cells = range_ft // FEET_PER_CELL
+        return [token_id for token_id, tx, ty in self._candidates(x - cells, y - cells, x + cells, y + cells)
+                if max(abs(tx - x), abs(ty - y)) <= cells]
+
+    def tokens_in_sphere(self, origin: Tuple[float, float], radius_ft: float) -> List[str]:
+        """Tokens inside a sphere, cylinder or circle centred on a point."""
+        ox, oy = origin
+        radius = radius_ft / FEET_PER_CELL
+        limit = radius * radius
+        return [token_id for token_id, x, y in self._candidates(ox - radius, oy - radius, ox + radius, oy + radius)
+                if (x + 0.5 - ox) ** 2 + (y + 0.5 - oy) ** 2 <= limit]
+
+    def tokens_in_cone(self, origin: Tuple[float, float], direction: Tuple[float, float], length_ft: float) -> List[str]:
+        """Tokens inside a cone starting at a point and pointing along a direction vector."""
+        ox, oy = origin
+        length = length_ft / FEET_PER_CELL
+        norm = math.hypot(*direction)
+        if not norm:
+            return []
+        dx, dy = direction[0] / norm, direction[1] / norm
+        cos_limit = math.cos(CONE_HALF_ANGLE)
+        found = []
+        for token_id, x, y in self._candidates(ox - length, oy - length, ox + length, oy + length):
+            vx, vy = x + 0.5 - ox, y + 0.5 - oy
+            distance = math.hypot(vx, vy)
+            if 0 < distance <= length and (vx * dx + vy * dy) / distance >= cos_limit:
+                found.append(token_id)
+        return found
+
+    def tokens_in_line(self, origin: Tuple[float, float], direction: Tuple[float, float], length_ft: float,
+                       width_ft: float = FEET_PER_CELL) -> List[str]:
+        """Tokens inside a line starting at a point and running along a direction vector."""
+        ox, oy = origin
+        length = length_ft / FEET_PER_CELL
+        half_width = width_ft / FEET_PER_CELL / 2
+        norm = math.hypot(*direction)
+        if not norm:
+            return []
+        dx, dy = direction[0] / norm, direction[1] / norm
+        end_x, end_y = ox + dx * length, oy + dy * length
+        found = []
+        for token_id, x, y in self._candidates(min(ox, end_x) - half_width, min(oy, end_y) - half_width,
+                                               max(ox, end_x) + half_width, max(oy, end_y) + half_width):
+            vx, vy = x + 0.5 - ox, y + 0.5 - oy
+            along = vx * dx + vy * dy
+            if 0 <= along <= length and abs(vx * dy - vy * dx) <= half_width:
+                found.append(token_id)
+        return found
@@ -0,0 +1,239 @@
+# src/content/pathfinding.py
+import heapq
+import math
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from src.content.map import FEET_PER_CELL, Map
+from src.core.observer import EventBus, EventType, Observer
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.pathfinding")
+
+DIAGONAL_RULES = ("5", "5/10/5", "euclidean")
+
+# Cost multiplier for entering NORMAL, DIFFICULT, WATER and STEEP cells with each movement
+# mode (PHB, chapter 8).  Climbing or swimming without the matching speed costs double;
+# None is impassable.
+TERRAIN_COST: Dict[str, Tuple[Optional[int], ...]] = {
+    "walk":   (1, 2, 2, 2),
+    "climb":  (1, 2, 2, 1),
+    "swim":   (1, 2, 1, 2),
+    "fly":    (1, 1, 1, 1),
+    "burrow": (1, 1, None, 1),
+}
+
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+_EUCLIDEAN_DIAGONAL = FEET_PER_CELL * math.sqrt(2)
+
+
+class CostField:
+    """Cheapest movement cost in feet from one origin to every reachable cell."""
+
+    __slots__ = ("origin", "width", "max_cost", "cost", "_final", "_previous")
+
+    def __init__(self, origin: Tuple[int, int], width: int, max_cost: float, cost: Dict[int, float],
+                 final: Dict[int, Tuple[int, int]], previous: Dict[Tuple[int, int], Tuple[int, int]]) -> None:
+        self.origin = origin
+        self.width = width
+        self.max_cost = max_cost      # Search stopped here; cells costing more are missing
+        self.cost = cost              # Cell index -> feet
+        self._final = final           # Cell index -> search state the cheapest cost was reached in
+        self._previous = previous     # Search state -> state it was reached from
+
+    def cost_to(self, x: int, y: int) -> Optional[float]:
+        return self.cost.get(y * self.width + x)
+
+    def path_to(self, x: int, y: int) -> Optional[List[Tuple[int, int]]]:
+        """Cells from the origin to (x, y), both included.  None if unreachable."""
+        state = self._final.get(y * self.width + x)
+        if state is None:
+            return None
+        path = []
+        while state is not None:
+            path.append((state[0] % self.width, state[0] // self.width))
+            state = self._previous.get(state)
+        path.reverse()
+        return path
+
+
+class Pathfinder(Observer):
+    """
+    Movement-mode-aware shortest paths on a Map.
+
+    reachable builds (or reuses) a Dijkstra cost field from the mover's cell that stops at
+    the mover's speed, so highlighting the reachable area only visits cells within reach.
+    path_to answers from that field when the destination is in it, and otherwise runs an A*
+    search towards the destination.  Fields are cached by origin, movement mode, diagonal
+    rule, map version and occupied squares; the cache is also cleared at the start of every
+    turn once attached to an encounter's event bus.
+
+    Diagonal rules:
+        - '5':          Every diagonal step costs 5 ft (PHB).
+        - '5/10/5':     Diagonal steps alternate 5 and 10 ft (DMG variant).
+        - 'euclidean':  Diagonal steps cost 5 * sqrt(2) ft.
+
+    Hostile creatures' squares are impassable; allies' squares can be crossed as difficult
+    terrain but not ended in.  Diagonal steps can't squeeze past a wall corner.
+    """
+
+    __slots__ = ("map", "cache_size", "_cache")
+
+    def __init__(self, battle_map: Map, cache_size: int = 64) -> None:
+        self.map = battle_map
+        self.cache_size = cache_size
+        self._cache: Dict[Tuple, CostField] = {}
+
+    def attach(self, bus: EventBus) -> None:
+        """Clear cached fields at the start of every turn."""
+        bus.subscribe(EventType.TURN_BEGIN, self)
+
+    def update(self, event: str, data: Optional[dict] = None) -> None:
+        if event == EventType.TURN_BEGIN:
+            self.clear()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _cells(self, token_ids: Iterable[str]) -> FrozenSet[int]:
+        cells = set()
+        for token_id in token_ids:
+            position = self.map.position(token_id)
+            if position is not None:
+                cells.add(position[1] * self.map.width + position[0])
+        return frozenset(cells)
+
+    def _key(self, origin: Tuple[int, int], mode: str, diagonal_rule: str,
+             blocked: FrozenSet[int], crossable: FrozenSet[int]) -> Tuple:
+        if mode not in TERRAIN_COST:
+            raise ValueError(f"Unknown movement mode '{mode}'.  Expected one of {tuple(TERRAIN_COST)}.")
+        if diagonal_rule not in DIAGONAL_RULES:
+            raise ValueError(f"Unknown diagonal rule '{diagonal_rule}'.  Expected one of {DIAGONAL_RULES}.")
+        return tuple(origin), mode, diagonal_rule, self.map.version, blocked, crossable
+
+    def cost_field(self, origin: Tuple[int, int], mode: str = "walk", diagonal_rule: str = "5",
+                   hostile: Iterable[str] = (), allies: Iterable[str] = (), max_cost: float = math.inf) -> CostField:
+        """
+        Movement cost field from a cell.
+
+        Args:
+            origin (Tuple[int, int]):   Cell the mover starts in.
+            mode (str):                 Movement mode: 'walk', 'climb', 'swim', 'fly' or 'burrow'.
+            diagonal_rule (str):        '5', '5/10/5' or 'euclidean'.
+            hostile (Iterable[str]):    Token IDs whose squares can't be entered.
+            allies (Iterable[str]):     Token IDs whose squares can be crossed but not ended in.
+            max_cost (float):           Optional.  Stop the search at this many feet.
+
+        Returns:
+            CostField:                  Cheapest cost in feet to every cell reachable within max_cost.
+        """
+        blocked, crossable = self._cells(hostile), self._cells(allies)
+        key = self._key(origin, mode, diagonal_rule, blocked, crossable)
+        field = self._cache.get(key)
+        if field is None or field.max_cost < max_cost:
+            field = self._search(tuple(origin), mode, diagonal_rule, blocked, crossable, max_cost)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = field
+        return field
+
+    def _search(self, origin: Tuple[int, int], mode: str, diagonal_rule: str, blocked: FrozenSet[int],
+                crossable: FrozenSet[int], max_cost: float = math.inf,
+                goal: Optional[Tuple[int, int]] = None) -> CostField:
+        battle_map = self.map
+        width, height = battle_map.width, battle_map.height
+        walls, terrain = battle_map.walls, battle_map.terrain
+        multipliers = TERRAIN_COST[mode]
+        alternating = diagonal_rule == "5/10/5"
+        diagonal = _EUCLIDEAN_DIAGONAL if diagonal_rule == "euclidean" else FEET_PER_CELL
+        limit = max_cost + 1e-9
+        goal_cell = None if goal is None else goal[1] * width + goal[0]
+        # A* towards a goal.  The estimate is the cost of the remaining distance over open
+        # ground, which never overestimates: every step costs at least its base cost.
+        diagonal_extra = 0.0 if alternating else diagonal - FEET_PER_CELL
+
+        def estimate(x: int, y: int) -> float:
+            if goal is None:
+                return 0
+            dx, dy = abs(x - goal[0]), abs(y - goal[1])
+            straight, diagonals = max(dx, dy), min(dx, dy)
+            if alternating:
+                return FEET_PER_CELL * (straight + diagonals // 2)
+            return FEET_PER_CELL * straight + diagonal_extra * diagonals
+
+        # Search states are (cell, parity); parity tracks whether the next diagonal costs 10 ft
+        # under the 5/10/5 rule and is always 0 otherwise.
+        start = (origin[1] * width + origin[0], 0)
+        best: Dict[Tuple[int, int], float] = {start: 0}
+        previous: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        cost: Dict[int, float] = {}
+        final: Dict[int, Tuple[int, int]] = {}
+        heap = [(estimate(*origin), 0, start)]
+        while heap:
+            _, spent, state = heapq.heappop(heap)
+            if spent > best[state]:
+                continue  # Stale heap entry
+            cell, parity = state
+            if cell not in cost:
+                cost[cell] = spent
+                final[cell] = state
+                if cell == goal_cell:
+                    break
+            x, y = cell % width, cell // width
+            for dx, dy in _STEPS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                if walls[neighbour] or neighbour in blocked:
+                    continue
+                multiplier = multipliers[terrain[neighbour]]
+                if multiplier is None:
+                    continue
+                if neighbour in crossable:
+                    multiplier = max(multiplier, 2)
+                next_parity = parity
+                if dx and dy:
+                    if walls[y * width + nx] or walls[ny * width + x]:
+                        continue
+                    if alternating:
+                        step = FEET_PER_CELL * 2 if parity else FEET_PER_CELL
+                        next_parity = 1 - parity
+                    else:
+                        step = diagonal
+                else:
+                    step = FEET_PER_CELL
+                total = spent + step * multiplier
+                if total > limit:
+                    continue
+                next_state = (neighbour, next_parity)
+                if total < best.get(next_state, math.inf):
+                    best[next_state] = total
+                    previous[next_state] = state
+                    heapq.heappush(heap, (total + estimate(nx, ny), total, next_state))
+        # Costs found on the way to a goal are only exact for the goal, so that field covers nothing.
+        return CostField(origin, width, max_cost if goal is None else 0, cost, final, previous)
+
+    def reachable(self, origin: Tuple[int, int], speed_ft: float, mode: str = "walk", diagonal_rule: str = "5",
+                  hostile: Iterable[str] = (), allies: Iterable[str] = ()) -> Dict[Tuple[int, int], float]:
+        """
+        Cells a mover can end its movement in, e.g. with speed_ft = creature.current_speed(mode).
+        Returns the cost in feet of each.
+        """
+        allies = tuple(allies)
+        field = self.cost_field(origin, mode, diagonal_rule, hostile, allies, max_cost=speed_ft)
+        occupied = self._cells(allies)
+        width = self.map.width
+        return {(cell % width, cell // width): spent for cell, spent in field.cost.items()
+                if spent <= speed_ft + 1e-9 and cell not in occupied}
+
+    def path_to(self, origin: Tuple[int, int], destination: Tuple[int, int], mode: str = "walk",
+                diagonal_rule: str = "5", hostile: Iterable[str] = (),
+                allies: Iterable[str] = ()) -> Optional[Tuple[List[Tuple[int, int]], float]]:
+        """Cheapest path between two cells and its cost in feet.  None if unreachable."""
+        blocked, crossable = self._cells(hostile), self._cells(allies)
+        field = self._cache.get(self._key(origin, mode, diagonal_rule, blocked, crossable))
+        if field is None or field.cost_to(*destination) is None:
+            field = self._search(tuple(origin), mode, diagonal_rule, blocked, crossable, goal=tuple(destination))
+        path = field.path_to(*destination)
+        if path is None:
+            return None
+        return path, field.cost_to(*destination)
@@ -0,0 +1,169 @@
+# src/content/visibility.py
+import math
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+from src.content.map import FEET_PER_CELL, Map
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.visibility")
+
+# Cover by number of blocked lines from the attacker's best corner (0 to 4).
+_COVER_BY_BLOCKED_LINES = ("none", "half", "half", "three_quarters", "total")
+
+# Transforms mapping each of the 8 octants onto the first one: (xx, xy, yx, yy).
+_OCTANTS = ((1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+            (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1))
+
+
+class VisionEngine:
+    """
+    Line of sight, fog of war and cover on a Map.
+
+    Visible cells are found with recursive shadowcasting over the map's wall layer, which
+    only visits cells that are actually in view, out to the viewer's sight range (default
+    'sight_ft', or a 'sight' entry in its senses).  Results are cached per (position,
+    senses) and the whole cache is dropped when the map's walls or lighting change, so a
+    token that hasn't moved costs nothing to re-check.  Terrain changes keep the cache.
+
+    Senses (ranges in feet) follow Creature.senses:
+        - darkvision:   See into dark cells within range.
+        - truesight:    Like darkvision, for this purpose.
+        - blindsight:   Perceive every cell in line of sight within range, light or dark.
+        - tremorsense:  Perceive every cell within range, through walls.
+        - sight:        Range of ordinary sight; defaults to the engine's 'sight_ft'.
+    """
+
+    def __init__(self, battle_map: Map, sight_ft: int = 120, cache_size: int = 1024) -> None:
+        self.map = battle_map
+        self.sight_ft = sight_ft
+        self.cache_size = cache_size
+        self._cache: Dict[Tuple, FrozenSet[int]] = {}
+        self._cache_version = battle_map.vision_version
+        self.explored: Set[int] = set()  # Every cell the party has seen, for fog of war
+
+    def _check_version(self) -> None:
+        if self._cache_version != self.map.vision_version:
+            self._cache.clear()
+            self._cache_version = self.map.vision_version
+
+    def line_of_sight(self, x: int, y: int, radius: Optional[int] = None) -> Set[int]:
+        """Cells (index y * width + x) in line of sight from a cell, within 'radius' cells (default: sight_ft)."""
+        battle_map = self.map
+        if radius is None:
+            radius = self.sight_ft // FEET_PER_CELL
+        visible = {y * battle_map.width + x}
+        for transform in _OCTANTS:
+            self._cast(x, y, 1, 1.0, 0.0, radius, transform, visible)
+        return visible
+
+    def _cast(self, cx: int, cy: int, row: int, start: float, end: float, radius: int,
+              transform: Tuple[int, int, int, int], visible: Set[int]) -> None:
+        if start < end:
+            return
+        battle_map = self.map
+        width, height, walls = battle_map.width, battle_map.height, battle_map.walls
+        xx, xy, yx, yy = transform
+        radius_squared = radius * radius
+        new_start = start
+        for distance in range(row, radius + 1):
+            dy = -distance
+            # Cells beyond the radius are skipped: their shadows only fall on cells further out.
+            dx = -min(distance, math.isqrt(radius_squared - distance * distance)) - 1
+            blocked = False
+            while dx < 0:
+                dx += 1
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                if end > left_slope:
+                    break
+                map_x, map_y = cx + dx * xx + dy * xy, cy + dx * yx + dy * yy
+                if 0 <= map_x < width and 0 <= map_y < height:
+                    cell = map_y * width + map_x
+                    visible.add(cell)
+                    wall = walls[cell]
+                else:
+                    wall = True
+                if blocked:
+                    if wall:
+                        new_start = right_slope
+                    else:
+                        blocked = False
+                        start = new_start
+                elif wall and distance < radius:
+                    blocked = True
+                    self._cast(cx, cy, distance + 1, start, left_slope, radius, transform, visible)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    def visible_cells(self, x: int, y: int, senses: Optional[Dict[str, int]] = None) -> FrozenSet[int]:
+        """Cells a creature at (x, y) can see or otherwise perceive with its senses."""
+        self._check_version()
+        senses = senses or {}
+        darkvision = max(senses.get("darkvision", 0), senses.get("truesight", 0)) // FEET_PER_CELL
+        blindsight = senses.get("blindsight", 0) // FEET_PER_CELL
+        tremorsense = senses.get("tremorsense", 0) // FEET_PER_CELL
+        sight = max(senses.get("sight", self.sight_ft) // FEET_PER_CELL, darkvision, blindsight)
+        key = (x, y, sight, darkvision, blindsight, tremorsense)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        battle_map = self.map
+        width = battle_map.width
+        darkness = battle_map.darkness
+        seen = self.line_of_sight(x, y, sight)
+        if darkness.find(1) != -1:
+            perceive_dark = max(darkvision, blindsight)
+            seen = {cell for cell in seen if not darkness[cell]
+                    or max(abs(cell % width - x), abs(cell // width - y)) <= perceive_dark}
+        if tremorsense:
+            for cell_y in range(max(0, y - tremorsense), min(battle_map.height, y + tremorsense + 1)):
+                row = cell_y * width
+                seen.update(row + cell_x for cell_x in range(max(0, x - tremorsense), min(width, x + tremorsense + 1)))
+
+        result = frozenset(seen)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def fog_of_war(self, viewers: Iterable[Tuple[int, int, Optional[Dict[str, int]]]]) -> Set[int]:
+        """
+        Cells currently visible to a group (e.g. the party), given (x, y, senses) for each
+        member.  Also adds them to 'explored'.
+        """
+        visible: Set[int] = set()
+        for x, y, senses in viewers:
+            visible |= self.visible_cells(x, y, senses)
+        self.explored |= visible
+        return visible
+
+    def _line_blocked(self, start: Tuple[float, float], end: Tuple[float, float],
+                      ignore: Tuple[Tuple[int, int], Tuple[int, int]]) -> bool:
+        steps = max(1, int(math.hypot(end[0] - start[0], end[1] - start[1]) * 4))
+        for step in range(1, steps):
+            fraction = step / steps
+            cell = (int(start[0] + (end[0] - start[0]) * fraction), int(start[1] + (end[1] - start[1]) * fraction))
+            if cell not in ignore and self.map.is_wall(*cell):
+                return True
+        return False
+
+    def cover(self, attacker: Tuple[int, int], target: Tuple[int, int]) -> str:
+        """
+        Cover a target has against an attacker, from walls (DMG, chapter 8): the attacker
+        picks the corner of its square with the clearest view and traces lines to each
+        corner of the target's square.  1-2 blocked lines is half cover, 3 is three-quarters
+        and 4 is total cover.
+        """
+        ax, ay = attacker
+        tx, ty = target
+        # Corners pulled slightly into the square so lines along walls don't clip them.
+        inset = (0.01, 0.99)
+        attacker_corners = [(ax + dx, ay + dy) for dx in inset for dy in inset]
+        target_corners = [(tx + dx, ty + dy) for dx in inset for dy in inset]
+        ignore = (attacker, target)
+        fewest = min(sum(self._line_blocked(corner, target_corner, ignore) for target_corner in target_corners)
+                     for corner in attacker_corners)
+        return _COVER_BY_BLOCKED_LINES[fewest]
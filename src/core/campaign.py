@@ -0,0 +1,232 @@
+# src/core/campaign.py
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from src.utils.logger import setup_logger
+from src.utils.manifest import file_entry, hash_bytes
+
+log = setup_logger("DMBuddy.campaign")
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+
+def _file_entry(directory: Path, file_path: Path, previous: Optional[dict]) -> dict:
+    # Only rehash files whose size or modification time changed since the last manifest.
+    return {"id": file_path.stem, "path": file_path.relative_to(directory).as_posix(),
+            **file_entry(str(file_path), previous)}
+
+
+def build_manifest(directory: str, previous: Optional[dict] = None) -> dict:
+    """
+    Scan a campaign directory for session files (session_XX.json) and their encounter
+    folders (session_XX/*.json).
+
+    Args:
+        directory (str):    Campaign directory.
+        previous (dict):    Optional.  Last manifest; unchanged files keep their hash.
+
+    Returns:
+        dict:               Manifest with one entry per session, each listing its encounters.
+    """
+    root = Path(directory)
+    known = {}
+    for session in (previous or {}).get("sessions", []):
+        known[session["path"]] = session
+        for encounter in session.get("encounters", []):
+            known[encounter["path"]] = encounter
+
+    sessions = []
+    for session_path in sorted(root.glob("session_*.json")):
+        entry = _file_entry(root, session_path, known.get(session_path.relative_to(root).as_posix()))
+        encounter_dir = session_path.with_suffix("")
+        entry["encounters"] = [_file_entry(root, encounter_path, known.get(encounter_path.relative_to(root).as_posix()))
+                               for encounter_path in sorted(encounter_dir.glob("*.json"))] if encounter_dir.is_dir() else []
+        sessions.append(entry)
+    return {"version": MANIFEST_VERSION, "sessions": sessions}
+
+
+class LazyDocument:
+    """
+    Proxy for a JSON file listed in the manifest.  The file is parsed on first access to
+    its data and kept afterwards; a hash mismatch is logged, since it means the file
+    changed after the manifest was written.
+    """
+
+    __slots__ = ("id", "path", "checksum", "_data", "_lock")
+
+    def __init__(self, entry: dict, directory: Path) -> None:
+        self.id: str = entry["id"]
+        self.path = directory / entry["path"]
+        self.checksum: str = entry.get("hash", "")
+        self._data: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._load()
+        return self._data
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            log.warning(f"'{self.path}' is listed in the campaign manifest but missing.  Using empty data.")
+            return {}
+        if self.checksum and hash_bytes(raw) != self.checksum:
+            log.warning(f"'{self.path}' changed since the campaign manifest was built.  Refresh the manifest.")
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            log.warning(f"'{self.path}' not properly formatted.  Using empty data.")
+            return {}
+
+    def unload(self) -> None:
+        """Drop the parsed data; the next access parses the file again."""
+        with self._lock:
+            self._data = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.id} {'loaded' if self.loaded else 'not loaded'}>"
+
+
+class LazySession(LazyDocument):
+    """Session proxy.  Its encounters are proxies too, built from the manifest without parsing."""
+
+    __slots__ = ("encounters",)
+
+    def __init__(self, entry: dict, directory: Path) -> None:
+        super().__init__(entry, directory)
+        self.encounters: Dict[str, LazyDocument] = {encounter["id"]: LazyDocument(encounter, directory)
+                                                    for encounter in entry.get("encounters", [])}
+
+
+class Campaign:
+    """
+    Campaign opened from its manifest.
+
+    A campaign is a file such as 'data/content/campaigns/my_first_campaign.json' and a
+    directory of the same name holding session_XX.json files and a session_XX/ folder of
+    encounters per session.  Opening reads the campaign file and the manifest only; sessions
+    and encounters are lazy proxies parsed on first access.  Opening a session queues the
+    next one for parsing on a background thread.  refresh rebuilds the manifest, rehashing
+    only files whose size or modification time changed.
+    """
+
+    def __init__(self, campaign_file: str, prefetch: bool = True) -> None:
+        self.campaign_file = Path(campaign_file)
+        self.directory = self.campaign_file.with_suffix("")
+        self.manifest_path = self.directory / MANIFEST_NAME
+        self.prefetch = prefetch
+        self.data: dict = {}
+        self.sessions: Dict[str, LazySession] = {}
+        self._order: List[str] = []
+        self._prefetch_queue: "queue.Queue[Optional[LazyDocument]]" = queue.Queue()
+        self._prefetcher: Optional[threading.Thread] = None
+
+    def open(self) -> "Campaign":
+        """Read the campaign file and its manifest (building the manifest if there is none)."""
+        if not self.campaign_file.is_file():
+            raise FileNotFoundError(f"Campaign file '{self.campaign_file}' not found.")
+        with open(self.campaign_file, "r") as f:
+            self.data = json.load(f)
+        manifest = None
+        if self.manifest_path.is_file():
+            try:
+                with open(self.manifest_path, "r") as f:
+                    manifest = json.load(f)
+            except json.JSONDecodeError:
+                log.warning(f"Campaign manifest '{self.manifest_path}' not properly formatted.  Rebuilding.")
+        if manifest is None or manifest.get("version") != MANIFEST_VERSION:
+            manifest = self.refresh()
+        self._load_manifest(manifest)
+        log.info(f"Opened campaign '{self.data.get('title', self.campaign_file.stem)}': {len(self.sessions)} session(s).")
+        return self
+
+    def _load_manifest(self, manifest: dict) -> None:
+        self.sessions = {entry["id"]: LazySession(entry, self.directory) for entry in manifest.get("sessions", [])}
+        self._order = list(self.sessions)
+
+    def refresh(self) -> dict:
+        """Rebuild and save the manifest, e.g. after adding or editing sessions outside the app."""
+        previous = None
+        if self.manifest_path.is_file():
+            try:
+                with open(self.manifest_path, "r") as f:
+                    previous = json.load(f)
+            except json.JSONDecodeError:
+                pass
+        manifest = build_manifest(str(self.directory), previous)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(temp_path, self.manifest_path)
+        self._load_manifest(manifest)
+        return manifest
+
+    def __iter__(self) -> Iterator[LazySession]:
+        return iter(self.sessions.values())
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def session(self, session_id: str) -> LazySession:
+        """Session proxy by ID (e.g. 'session_01'), queueing the following session for prefetch."""
+        if session_id not in self.sessions:
+            raise KeyError(f"Campaign has no session '{session_id}'.")
+        position = self._order.index(session_id)
+        if self.prefetch and position + 1 < len(self._order):
+            self._queue_prefetch(self.sessions[self._order[position + 1]])
+        return self.sessions[session_id]
+
+    def latest_session(self) -> Optional[LazySession]:
+        return self.session(self._order[-1]) if self._order else None
+
+    def encounter(self, session_id: str, encounter_id: str) -> LazyDocument:
+        encounters = self.session(session_id).encounters
+        if encounter_id not in encounters:
+            raise KeyError(f"Session '{session_id}' has no encounter '{encounter_id}'.")
+        return encounters[encounter_id]
+
+    def _queue_prefetch(self, document: LazyDocument) -> None:
+        if document.loaded:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = threading.Thread(target=self._prefetch_worker, name="campaign-prefetch", daemon=True)
+            self._prefetcher.start()
+        self._prefetch_queue.put(document)
+
+    def _prefetch_worker(self) -> None:
+        while True:
+            document = self._prefetch_queue.get()
+            if document is None:
+                return
+            try:
+                document.data
+            except Exception as e:
+                log.warning(f"Prefetching '{document.path}' failed: {e}")
+
+    def close(self) -> None:
+        """Stop the prefetch thread."""
+        if self._prefetcher is not None:
+            self._prefetch_queue.put(None)
+            self._prefetcher.join()
+            self._prefetcher = None
@@ -0,0 +1,142 @@
+# src/core/combat.py
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.core.dice import Roller, validate_string
+from src.core.history import History
+from src.utils.dice_options import OptionRegistry
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.combat")
+
+_dice_cache: Dict[str, Dict[str, int]] = {}  # Parsed damage dice, keyed by dice string
+_SAVE_DIE = {"count": 1, "sides": 20, "modifier": 0}
+
+
+def _parse_dice(dice_string: str) -> Optional[Dict[str, int]]:
+    """Parse a damage dice string once and cache the result."""
+    if dice_string not in _dice_cache:
+        is_valid, result = validate_string(dice_string, OptionRegistry())
+        if not is_valid:
+            return None
+        _dice_cache[dice_string] = result
+    return _dice_cache[dice_string]
+
+
+def damage_profile(target, damage_type: str) -> Tuple[bool, bool, bool]:
+    """
+    Look up how a target is affected by a damage type.
+
+    Returns:
+        Tuple[bool, bool, bool]:    (immune, resistant, vulnerable)
+    """
+    return (damage_type in getattr(target, "damage_immunities", ()),
+            damage_type in getattr(target, "damage_resistances", ()),
+            damage_type in getattr(target, "damage_vulnerabilities", ()))
+
+
+def modify_damage(value: int, profile: Tuple[bool, bool, bool]) -> int:
+    """Apply immunity, resistance (rounded down) and vulnerability, in that order."""
+    immune, resistant, vulnerable = profile
+    if immune:
+        return 0
+    if resistant:
+        value //= 2
+    if vulnerable:
+        value *= 2
+    return value
+
+
+def save_bonus(target, ability: str) -> int:
+    """Saving throw bonus for a target: ability modifier plus any listed save bonus."""
+    if hasattr(target, "saving_throw"):
+        return target.saving_throw(ability)
+    stats = getattr(target, "stats", {})
+    saves = getattr(target, "saves", {})
+    return (stats.get(ability, 10) - 10) // 2 + saves.get(ability, 0)
+
+
+def apply_damage(target, value: int, history: Optional[History] = None) -> Tuple[int, int]:
+    """
+    Apply already-modified damage to a target, spending temporary hit points first.
+    Changes are recorded in 'history', if given, so they can be undone.
+
+    Returns:
+        Tuple[int, int]:    Hit points before and after the damage.
+    """
+    set_attr = history.set_attr if history is not None else setattr
+    hp_before = target.current_hp
+    temp_hp = getattr(target, "temp_hp", 0)
+    if temp_hp:
+        absorbed = min(temp_hp, value)
+        set_attr(target, "temp_hp", temp_hp - absorbed)
+        value -= absorbed
+    set_attr(target, "current_hp", max(0, hp_before - value))
+    return hp_before, target.current_hp
+
+
+def resolve_area_effect(effect: dict, targets: Sequence, roller: Optional[Roller] = None,
+                        history: Optional[History] = None) -> List[dict]:
+    """
+    Resolve a damaging area effect (e.g. Fireball) against every target in one pass.
+
+    The damage is rolled once and shared by all targets, every saving throw is rolled in a
+    single batch, and the final damage is computed once per distinct (save result, damage
+    profile) pair rather than once per target.  The outcome is the same as resolving each
+    target individually with the same rolls.
+
+    Args:
+        effect (dict):          Effect details.  Keys used:
+                                    - damage_dice:  Dice string, e.g. '8d6'.
+                                    - damage_type:  Damage type, e.g. 'fire'.
+                                    - save:         Optional.  Ability used for the saving throw.
+                                    - save_dc:      Optional.  Saving throw difficulty class.
+                                    - save_success: Optional.  'half' (default) or 'none'.
+        targets (Sequence):     Creatures caught in the area.
+        roller (Roller):        Optional.  Dice roller to use.
+        history (History):      Optional.  Records the hit point changes as one undoable action.
+
+    Returns:
+        List[dict]:             One result record per target, in target order.
+    """
+
+    roller = roller or Roller()
+    damage_type = effect.get("damage_type", "")
+    dice = _parse_dice(effect.get("damage_dice", ""))
+    if dice is None:
+        log.warning(f"Invalid damage dice '{effect.get('damage_dice')}' for area effect.  Ignoring effect.")
+        return []
+
+    damage = roller.roll_standard(dice)[-1]
+    save_ability = effect.get("save")
+    save_dc = effect.get("save_dc", 0)
+    success_damage = damage // 2 if effect.get("save_success", "half") == "half" else 0
+
+    if save_ability:
+        save_rolls = roller.roll_batch(_SAVE_DIE, len(targets))
+    else:
+        save_rolls = [None] * len(targets)
+
+    final_damage: Dict[Tuple[bool, Tuple[bool, bool, bool]], int] = {}
+    results: List[dict] = []
+    recording = history.action(f"{damage_type} area effect".strip()) if history is not None else nullcontext()
+    with recording:
+        for target, save_roll in zip(targets, save_rolls):
+            saved = False
+            if save_roll is not None:
+                save_roll += save_bonus(target, save_ability)
+                saved = save_roll >= save_dc
+            profile = damage_profile(target, damage_type)
+            key = (saved, profile)
+            if key not in final_damage:
+                final_damage[key] = modify_damage(success_damage if saved else damage, profile)
+            hp_before, hp_after = apply_damage(target, final_damage[key], history)
+            results.append({"target": target,
+                            "save_roll": save_roll,
+                            "saved": saved,
+                            "damage": final_damage[key],
+                            "hp_before": hp_before,
+                            "hp_after": hp_after})
+
+    saved_count = sum(1 for result in results if result["saved"])
+    log.info(f"Area effect: {damage} {damage_type} damage rolled against {len(results)} targets, {saved_count} saved.")
+    return results
@@ -1,5 +1,4 @@
 import json
-from jsonschema import validate, ValidationError
 from src.models.schemas import THEME_SCHEMA, APP_THEME_SCHEMA, MENU_SCHEMA
 
 class ConfigLoader:
@@ -21,6 +20,8 @@ class ConfigLoader:
         return self._load_and_validate(self.menu_file, MENU_SCHEMA)
 
     def _load_and_validate(self, file_path: str, schema: dict) -> dict:
+        # jsonschema is slow to import; only pay for it when a file is actually validated.
+        from jsonschema import validate, ValidationError
         try:
             with open(file_path, 'r') as f:
                 data = json.load(f)
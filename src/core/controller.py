@@ -1,14 +1,171 @@
 # src/core/controller.py
+import time
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from contextlib import ExitStack
+from typing import Any, Callable, Deque, Dict, List, Optional
+from src.core.combat import apply_damage
 from src.utils.json_cache import JSONCache
 from src.utils.logger import setup_logger
 
+
+class Command(metaclass=ABCMeta):
+    """
+    One GUI action, queued on the DMController and run by its dispatcher.
+
+    Subclasses implement execute and, if two of them can be applied as one, merge.
+    """
+
+    def __init__(self):
+        self.enqueued_at: float = 0.0
+        self.latency: Optional[float] = None  # Seconds from enqueue to completion
+        self.result: Any = None
+
+    @property
+    def merge_key(self) -> Optional[tuple]:
+        """Commands with the same key are offered to each other for merging."""
+        return None
+
+    def merge(self, other: "Command") -> bool:
+        """Absorb a later command.  Returns False if the two can't be combined."""
+        return False
+
+    @abstractmethod
+    def execute(self, controller: "DMController") -> Any:
+        pass
+
+
+class ButtonCommand(Command):
+    def __init__(self, button_name: str):
+        super().__init__()
+        self.button_name = button_name
+
+    def execute(self, controller: "DMController") -> Any:
+        controller.log.debug(f"Processing click for button: {self.button_name}")
+        # Add game logic here, e.g., load character data, roll dice, etc.
+        return f"Action for {self.button_name} executed"
+
+
+class AdjustHP(Command):
+    """Damage (negative amount) or heal (positive amount) a combatant."""
+
+    def __init__(self, combatant_id: str, amount: int):
+        super().__init__()
+        self.combatant_id = combatant_id
+        self.amount = amount
+
+    @property
+    def merge_key(self) -> Optional[tuple]:
+        return ("hp", self.combatant_id)
+
+    def merge(self, other: Command) -> bool:
+        if not isinstance(other, AdjustHP) or other.combatant_id != self.combatant_id:
+            return False
+        # Only same-direction changes merge: damage then healing isn't the same as their sum
+        # once temporary hit points or 0 HP are involved.
+        if (self.amount < 0) != (other.amount < 0):
+            return False
+        self.amount += other.amount
+        return True
+
+    def execute(self, controller: "DMController") -> Any:
+        creature = controller.encounter.combatants.get(self.combatant_id)
+        if creature is None:
+            controller.log.warning(f"No combatant '{self.combatant_id}' to adjust.  Ignored.")
+            return None
+        history = controller.encounter.history
+        if self.amount < 0:
+            return apply_damage(creature, -self.amount, history)
+        hp_before = creature.current_hp
+        history.set_attr(creature, "current_hp", min(creature.max_hp, hp_before + self.amount))
+        return hp_before, creature.current_hp
+
+
 class DMController:
-    def __init__(self, jcache: JSONCache):
+    def __init__(self, jcache: JSONCache, encounter=None,
+                 on_save: Optional[Callable[[], None]] = None, on_redraw: Optional[Callable[[], None]] = None):
+        """
+        Turns GUI actions into queued commands.
+
+        Args:
+            jcache (JSONCache):     Instance of JSONCache for reading configuration data.
+            encounter (Encounter):  Optional.  Encounter commands act on.
+            on_save (Callable):     Optional.  Called once after each batch of commands.
+            on_redraw (Callable):   Optional.  Called once after each batch of commands.
+        """
         self.jcache = jcache
+        self.encounter = encounter
+        self.on_save = on_save
+        self.on_redraw = on_redraw
         self.log = setup_logger(__name__, jcache)
+        self._queue: List[Command] = []
+        self._pending_dispatch: Optional[str] = None
+        self.latencies: Deque[float] = deque(maxlen=1000)  # Seconds, most recent commands
         self.log.info("DMController initialized")
 
-    def handle_button_click(self, button_name: str):
-        self.log.debug(f"Processing click for button: {button_name}")
-        # Add game logic here, e.g., load character data, roll dice, etc.
-        return f"Action for {button_name} executed"
\ No newline at end of file
+    def enqueue(self, command: Command, root=None) -> Command:
+        """
+        Queue a command, merging it into a queued one if they are compatible.  With a Tk
+        'root', a dispatch is scheduled for when the GUI is next idle, so a burst of clicks
+        is applied as one batch.
+        """
+        command.enqueued_at = time.perf_counter()
+        key = command.merge_key
+        if key is not None:
+            # Only the latest command with the same key may absorb it, so order is preserved.
+            for queued in reversed(self._queue):
+                if queued.merge_key == key:
+                    if queued.merge(command):
+                        return queued
+                    break
+        self._queue.append(command)
+        if root is not None and self._pending_dispatch is None:
+            self._pending_dispatch = root.after_idle(self.dispatch)
+        return command
+
+    def handle_button_click(self, button_name: str) -> str:
+        """Run a button's action now (with anything already queued) and return its result."""
+        command = self.enqueue(ButtonCommand(button_name))
+        self.dispatch()
+        return command.result
+
+    def queue_button_click(self, button_name: str, root=None) -> Command:
+        """Queue a button's action for the next dispatch, e.g. from a Tk callback."""
+        return self.enqueue(ButtonCommand(button_name), root)
+
+    def dispatch(self) -> List[Command]:
+        """
+        Run every queued command as one state transition: a single undoable action and a
+        single batch of events, followed by one save and one redraw.
+
+        Returns:
+            List[Command]:  Commands run, with their results and latencies.
+        """
+        self._pending_dispatch = None
+        batch, self._queue = self._queue, []
+        if not batch:
+            return batch
+        with ExitStack() as stack:
+            if self.encounter is not None:
+                stack.enter_context(self.encounter.history.action(f"{len(batch)} command(s)"))
+                stack.enter_context(self.encounter.event_bus.batch())
+            for command in batch:
+                try:
+                    command.result = command.execute(self)
+                except Exception as e:
+                    self.log.error(f"Command {type(command).__name__} failed: {e!r}")
+        for callback in (self.on_save, self.on_redraw):
+            if callback is not None:
+                callback()
+        finished = time.perf_counter()
+        for command in batch:
+            command.latency = finished - command.enqueued_at
+            self.latencies.append(command.latency)
+        return batch
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Enqueue-to-complete latency of recent commands, in milliseconds."""
+        if not self.latencies:
+            return {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {"count": len(self.latencies), "mean_ms": sum(self.latencies) / len(self.latencies) * 1000,
+                "max_ms": max(self.latencies) * 1000}
@@ -0,0 +1,209 @@
+# src/core/designer.py
+import heapq
+import itertools
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from src.utils.json_cache import JSONCache
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.designer")
+
+DIFFICULTIES = ("easy", "medium", "hard", "deadly")
+
+# XP thresholds per character level (DMG, chapter 3): easy, medium, hard, deadly.
+XP_THRESHOLDS: Dict[int, Tuple[int, int, int, int]] = {
+    1: (25, 50, 75, 100), 2: (50, 100, 150, 200), 3: (75, 150, 225, 400), 4: (125, 250, 375, 500),
+    5: (250, 500, 750, 1100), 6: (300, 600, 900, 1400), 7: (350, 750, 1100, 1700),
+    8: (450, 900, 1400, 2100), 9: (550, 1100, 1600, 2400), 10: (600, 1200, 1900, 2800),
+    11: (800, 1600, 2400, 3600), 12: (1000, 2000, 3000, 4500), 13: (1100, 2200, 3400, 5100),
+    14: (1250, 2500, 3800, 5700), 15: (1400, 2800, 4300, 6400), 16: (1600, 3200, 4800, 7200),
+    17: (2000, 3900, 5900, 8800), 18: (2100, 4200, 6300, 9500), 19: (2400, 4900, 7300, 10900),
+    20: (2800, 5700, 8500, 12700)}
+
+CR_XP: Dict[str, int] = {
+    "0": 10, "1/8": 25, "1/4": 50, "1/2": 100, "1": 200, "2": 450, "3": 700, "4": 1100, "5": 1800,
+    "6": 2300, "7": 2900, "8": 3900, "9": 5000, "10": 5900, "11": 7200, "12": 8400, "13": 10000,
+    "14": 11500, "15": 13000, "16": 15000, "17": 18000, "18": 20000, "19": 22000, "20": 25000,
+    "21": 33000, "22": 41000, "23": 50000, "24": 62000, "25": 75000, "26": 90000, "27": 105000,
+    "28": 120000, "29": 135000, "30": 155000}
+
+_MULTIPLIERS = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0)
+# Index into _MULTIPLIERS by number of monsters (15 or more use the last entry).
+_GROUP_INDEX = [1, 1, 2] + [3] * 4 + [4] * 4 + [5] * 4 + [6]
+
+
+def cr_value(cr) -> float:
+    """Numeric value of a challenge rating given as a number or a string such as '1/4'."""
+    if isinstance(cr, str) and "/" in cr:
+        numerator, denominator = cr.split("/")
+        return int(numerator) / int(denominator)
+    return float(cr)
+
+
+def cr_key(cr) -> str:
+    """Normalize a challenge rating to its key in CR_XP."""
+    value = cr_value(cr)
+    for key in ("1/8", "1/4", "1/2"):
+        if value == cr_value(key):
+            return key
+    return str(int(value))
+
+
+def group_multiplier(monster_count: int, party_size: int) -> float:
+    """Encounter multiplier for the number of monsters, adjusted for small or large parties."""
+    index = _GROUP_INDEX[min(monster_count, len(_GROUP_INDEX) - 1)]
+    if party_size < 3:
+        index += 1
+    elif party_size >= 6:
+        index -= 1
+    return _MULTIPLIERS[index]
+
+
+def xp_budget(party_levels: Sequence[int], difficulty: str) -> Tuple[int, int]:
+    """
+    Adjusted XP range for a difficulty: from its threshold up to the next difficulty's
+    threshold (deadly is open-ended, capped at one and a half times its threshold).
+    """
+    column = DIFFICULTIES.index(difficulty)
+    low = sum(XP_THRESHOLDS[level][column] for level in party_levels)
+    if column + 1 < len(DIFFICULTIES):
+        high = sum(XP_THRESHOLDS[level][column + 1] for level in party_levels)
+    else:
+        high = low * 3 // 2
+    return low, high
+
+
+def load_monster_index(directory: str = "data/monsters") -> List[dict]:
+    """Read the species files in a directory into index entries for the encounter builder."""
+    index = []
+    for file_path in sorted(Path(directory).glob("*.json")):
+        try:
+            with open(file_path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            log.warning(f"Species file '{file_path}' not properly formatted.  Ignored.")
+            continue
+        cr = data.get("challenge_rating", data.get("cr"))
+        if cr is None:
+            log.warning(f"Species file '{file_path}' has no challenge rating.  Ignored.")
+            continue
+        index.append({"species": file_path.stem,
+                      "cr": cr,
+                      "creature_type": data.get("creature_type", ""),
+                      "environment": data.get("environment", [])})
+    return index
+
+
+class EncounterBuilder:
+    """
+    Searches a monster index for groups that hit a party's XP budget.
+
+    Monsters are bucketed by XP value once, up front.  The search runs over the few dozen
+    distinct XP values instead of over every species, adding monsters in increasing XP
+    order and pruning a branch as soon as its adjusted XP passes the budget (adding
+    monsters never lowers the adjusted XP).  Species are only assigned to the best XP
+    combinations at the end, rotating through species that share an XP value.
+    """
+
+    def __init__(self, monsters: Iterable[dict]) -> None:
+        self.monsters: List[dict] = []
+        for monster in monsters:
+            key = cr_key(monster["cr"])
+            if key not in CR_XP:
+                log.warning(f"Invalid challenge rating '{monster['cr']}' for '{monster.get('species')}'.  Ignored.")
+                continue
+            self.monsters.append(dict(monster, cr=key, xp=CR_XP[key]))
+
+    def _buckets(self, creature_types, environments, cr_range) -> Dict[int, List[dict]]:
+        buckets: Dict[int, List[dict]] = {}
+        for monster in self.monsters:
+            if creature_types and monster.get("creature_type") not in creature_types:
+                continue
+            if environments and not set(monster.get("environment", [])) & set(environments):
+                continue
+            if cr_range and not cr_value(cr_range[0]) <= cr_value(monster["cr"]) <= cr_value(cr_range[1]):
+                continue
+            buckets.setdefault(monster["xp"], []).append(monster)
+        return buckets
+
+    def build(self, party_levels: Sequence[int], difficulty: str = "medium",
+              creature_types: Optional[Iterable[str]] = None, environments: Optional[Iterable[str]] = None,
+              cr_range: Optional[Tuple] = None, top_n: int = 5, max_monsters: int = 12,
+              max_kinds: int = 3) -> List[dict]:
+        """
+        Find the monster groups closest to the middle of the budget for a difficulty.
+
+        Args:
+            party_levels (Sequence[int]):   Level of each character in the party.
+            difficulty (str):               'easy', 'medium', 'hard' or 'deadly'.
+            creature_types (Iterable[str]): Optional.  Only use these creature types.
+            environments (Iterable[str]):   Optional.  Only use monsters found in these environments.
+            cr_range (Tuple):               Optional.  (lowest, highest) challenge rating allowed.
+            top_n (int):                    Number of candidates to return.
+            max_monsters (int):             Largest group size considered.
+            max_kinds (int):                Largest number of different challenge ratings in a group.
+
+        Returns:
+            List[dict]:                     Candidates, best first, each with 'monsters' (species,
+                                            cr, count), 'xp', 'adjusted_xp' and 'difficulty'.
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty '{difficulty}'.  Expected one of {DIFFICULTIES}.")
+        party_size = len(party_levels)
+        low, high = xp_budget(party_levels, difficulty)
+        middle = (low + high) / 2
+        buckets = self._buckets(set(creature_types or ()), set(environments or ()), cr_range)
+        values = sorted(buckets)
+
+        # Best XP combinations as a bounded max-heap on distance from the middle of the budget.
+        best: List[Tuple[float, int, Tuple[Tuple[int, int], ...], int, int]] = []
+        tie = itertools.count()
+
+        def search(start: int, chosen: List[Tuple[int, int]], raw_xp: int, count: int) -> None:
+            for i in range(start, len(values)):
+                xp = values[i]
+                for extra in range(1, max_monsters - count + 1):
+                    total = raw_xp + xp * extra
+                    adjusted = int(total * group_multiplier(count + extra, party_size))
+                    if adjusted >= high:
+                        break
+                    combination = chosen + [(xp, extra)]
+                    if adjusted >= low:
+                        entry = (-abs(adjusted - middle), next(tie), tuple(combination), total, adjusted)
+                        if len(best) < top_n:
+                            heapq.heappush(best, entry)
+                        elif entry[0] > best[0][0]:
+                            heapq.heapreplace(best, entry)
+                    if len(combination) < max_kinds:
+                        search(i + 1, combination, total, count + extra)
+                # Cheapest single monster of this value already busts the budget: so do the rest.
+                if int((raw_xp + xp) * group_multiplier(count + 1, party_size)) >= high:
+                    break
+
+        search(0, [], 0, 0)
+
+        candidates = []
+        rotation: Dict[int, int] = {}  # Rotate through species of equal XP for variety
+        for _, _, combination, total, adjusted in sorted(best, key=lambda entry: (-entry[0], entry[1])):
+            monsters = []
+            for xp, count in combination:
+                pick = rotation.get(xp, 0)
+                rotation[xp] = pick + 1
+                monster = buckets[xp][pick % len(buckets[xp])]
+                monsters.append({"species": monster["species"], "cr": monster["cr"], "count": count})
+            candidates.append({"monsters": monsters, "xp": total, "adjusted_xp": adjusted,
+                               "difficulty": difficulty})
+        log.info(f"Encounter builder: {len(candidates)} {difficulty} candidate(s) for budget {low}-{high} XP.")
+        return candidates
+
+
+def write_encounter(candidate: dict, file_path: str, title: str, jcache: Optional[JSONCache] = None) -> dict:
+    """Save a candidate from EncounterBuilder.build as an encounter.json file."""
+    data = {"title": title,
+            "resources": {"storage": str(Path(file_path).parent),
+                          "monsters": [{"species": monster["species"],
+                                        "count": monster["count"],
+                                        "overrides": {}} for monster in candidate["monsters"]]}}
+    (jcache or JSONCache(file_path)).set(file_path, data)
+    return data
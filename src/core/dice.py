@@ -83,6 +83,34 @@ class Roller:
         return empty_result
 
 
+    def roll_batch(self, dice: Dict[str, int], times: int) -> List[int]:
+        """
+        Roll the same dice a number of times in a single pass, e.g. one saving throw
+        for every target caught in an area effect.
+
+        Args:
+            dice (Dict[str, int]):              Dictionary representing number and sides of dice to be
+                                                rolled and the modifier.
+            times (int):                        Number of independent rolls.
+
+        Returns:
+            List[int]:                          Total of each roll (modifier applied), in roll order.
+        """
+
+        if times <= 0:
+            return []
+        if dice["count"] <= 0 or dice["sides"] <= 0:
+            log.warning(f"Cannot have negative or zero values for dice or sides: '{dice}'.  Ignoring batch roll.")
+            return []
+
+        faces = range(1, dice["sides"] + 1)
+        count = dice["count"]
+        modifier = dice["modifier"]
+        rolls = random.choices(faces, k=times * count)
+        if count == 1:
+            return [value + modifier for value in rolls]
+        return [sum(rolls[i:i + count]) + modifier for i in range(0, times * count, count)]
+
     def roll_standard(self, dice: Dict[str, int]) -> Tuple[str, Tuple[int, int], int]:
         # print("Standard Roll.")
         rolls = [random.randint(1, dice["sides"]) for _ in range(dice["count"])]
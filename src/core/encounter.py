@@ -1,8 +1,82 @@
+import uuid
+from typing import Dict, List, Optional
+from src.core.history import History
+from src.core.initiative import InitiativeTracker
+from src.core.journal import Journal
+from src.core.observer import EventBus, EventType
+from src.core.scheduler import EffectScheduler
+
 class Encounter:
-    def __init__(self, dice_roller):
+    def __init__(self, dice_roller, history_depth: int = 200, journal: Optional[Journal] = None):
         self.dice_roller = dice_roller  # Injected dependency
-        self.combatants = []
+        self.history = History(history_depth)
+        self.combatants: Dict[str, object] = {}  # Combatant ID -> creature
+        self._combatant_ids: Dict[int, str] = {}  # id(creature) -> combatant ID, for the journal
+        self.journal = journal
+        if journal is not None:
+            self.history.add_listener(self._journal_change)
+        self.initiative = InitiativeTracker()
+        self.event_bus = EventBus()
+        self.effect_scheduler = EffectScheduler()
+        self.event_bus.subscribe(EventType.SAVE_SUCCEEDED, self._on_save_succeeded)
+        self.event_bus.subscribe(EventType.ITEM_UNEQUIPPED, self._on_item_unequipped)
+
+    def add_combatant(self, creature, combatant_id: Optional[str] = None) -> str:
+        """Roll initiative for a creature and add it to the turn order.  Returns its combatant ID."""
+        combatant_id = combatant_id or uuid.uuid4().hex
+        if hasattr(creature, "initiative_bonus"):
+            bonus = creature.initiative_bonus
+        elif hasattr(creature, "ability_modifier"):
+            bonus = creature.ability_modifier("dexterity")
+        else:
+            bonus = 0
+        initiative = self.dice_roller.roll({"count": 1, "sides": 20, "modifier": bonus})[-1]
+        dexterity = getattr(creature, "stats", {}).get("dexterity", 10)
+        self.combatants[combatant_id] = creature
+        self._combatant_ids[id(creature)] = combatant_id
+        self.initiative.add(combatant_id, initiative, dexterity)
+        return combatant_id
+
+    def remove_combatant(self, combatant_id: str) -> None:
+        self.initiative.remove(combatant_id)
+        creature = self.combatants.pop(combatant_id, None)
+        if creature is not None:
+            self._combatant_ids.pop(id(creature), None)
+            if self.journal is not None:
+                self.journal.record("del", ["combatants", combatant_id])
+
+    def _journal_change(self, owner, field, is_key: bool, value) -> None:
+        """Journal a combatant field written through the history (including undo and redo)."""
+        combatant_id = None if is_key else self._combatant_ids.get(id(owner))
+        if combatant_id is not None:
+            self.journal.record("set", ["combatants", combatant_id, field], value)
+
+    def next_turn(self) -> Optional[str]:
+        """End the current combatant's turn and begin the next one.  Returns the new combatant ID."""
+        ending = self.initiative.current()
+        expired: List = []
+        if ending is not None:
+            expired += self.effect_scheduler.end_turn(ending)
+            self.event_bus.publish(EventType.TURN_END, {"combatant": ending}, source=ending)
+        beginning = self.initiative.next_turn()
+        if beginning is not None:
+            expired += self.effect_scheduler.begin_turn(beginning)
+            self.event_bus.publish(EventType.TURN_BEGIN, {"combatant": beginning, "round": self.initiative.round},
+                                   source=beginning)
+        self._end_effects(expired)
+        return beginning
+
+    def _end_effects(self, effects: List) -> None:
+        """Take effects the scheduler has ended off their creatures."""
+        for effect in effects:
+            creature = self.combatants.get(effect.target)
+            if creature is not None and hasattr(creature, "remove_active_effect"):
+                creature.remove_active_effect(effect)
+
+    def _on_save_succeeded(self, event: str, data: Optional[dict] = None) -> None:
+        data = data or {}
+        self._end_effects(self.effect_scheduler.save_succeeded(data.get("target"), data.get("effect")))
 
-    def add_combatant(self, creature):
-        initiative = self.dice_roller.roll("1d20") + creature.initiative_bonus
-        self.combatants.append((initiative, creature))
\ No newline at end of file
+    def _on_item_unequipped(self, event: str, data: Optional[dict] = None) -> None:
+        data = data or {}
+        self._end_effects(self.effect_scheduler.item_unequipped(data.get("item_id")))
@@ -0,0 +1,170 @@
+# src/core/history.py
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.history")
+
+_MISSING = object()  # Marks a dictionary key that did not exist before a change
+
+
+def _invalidate_derived(owner, field, old, new) -> None:
+    """
+    Clear derived stats (see DerivedStats) cached on 'owner' that read an attribute written
+    directly, so writes by the history match the creature's own setters.  The attribute is
+    the input (field,); for a dictionary attribute such as 'stats', each (field, key) too.
+    """
+    derived = getattr(owner, "derived", None)
+    if derived is None or not hasattr(derived, "invalidate"):
+        return
+    inputs = [(field,)]
+    for value in (old, new):
+        if isinstance(value, dict):
+            inputs.extend((field, key) for key in value)
+    derived.invalidate(*inputs)
+
+
+class Action:
+    """
+    One undoable action: the list of field changes it made, each stored with its old and
+    new value.  Undo and redo replay only those fields, never the whole encounter.
+    """
+
+    __slots__ = ("label", "changes")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.changes: List[Tuple[Any, Any, bool, Any, Any]] = []  # (owner, field, is_key, old, new)
+
+    @staticmethod
+    def _write(owner, field, is_key: bool, value, replaced) -> None:
+        if is_key:
+            if value is _MISSING:
+                owner.pop(field, None)
+            else:
+                owner[field] = value
+        else:
+            setattr(owner, field, value)
+            _invalidate_derived(owner, field, replaced, value)
+
+    def undo(self) -> None:
+        for owner, field, is_key, old, new in reversed(self.changes):
+            self._write(owner, field, is_key, old, new)
+
+    def redo(self) -> None:
+        for owner, field, is_key, old, new in self.changes:
+            self._write(owner, field, is_key, new, old)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __repr__(self):
+        return f"Action: {self.label} ({len(self.changes)} changes)."
+
+
+class History:
+    """
+    Undo/redo log for encounter state.
+
+    State is changed through set_attr/set_item inside an action, which records only the
+    changed fields.  Undo and redo are O(changed fields) and the number of actions kept is
+    limited by 'depth', so a long encounter with full history stays small in memory.
+    Listeners are told about every field written, including by undo and redo.
+    """
+
+    def __init__(self, depth: int = 200) -> None:
+        self._undo: Deque[Action] = deque(maxlen=depth)
+        self._redo: List[Action] = []
+        self._open: Optional[Action] = None
+        self._listeners: List[Callable[[Any, Any, bool, Any], None]] = []
+
+    def add_listener(self, callback: Callable[[Any, Any, bool, Any], None]) -> None:
+        """Call 'callback(owner, field, is_key, value)' after each field is written."""
+        self._listeners.append(callback)
+
+    def _notify(self, owner, field, is_key: bool, value) -> None:
+        for callback in self._listeners:
+            callback(owner, field, is_key, value)
+
+    @property
+    def depth(self) -> int:
+        return self._undo.maxlen
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @contextmanager
+    def action(self, label: str) -> Iterator[Action]:
+        """Group every change made inside the block into one undoable action."""
+        if self._open is not None:
+            # Nested actions fold into the outer one.
+            yield self._open
+            return
+        self._open = Action(label)
+        try:
+            yield self._open
+        finally:
+            action, self._open = self._open, None
+            if action.changes:
+                self._undo.append(action)
+                self._redo.clear()
+
+    def _record(self, owner, field, is_key: bool, old, new) -> None:
+        if self._open is None:
+            with self.action(f"set {field}"):
+                self._open.changes.append((owner, field, is_key, old, new))
+        else:
+            self._open.changes.append((owner, field, is_key, old, new))
+        self._notify(owner, field, is_key, new)
+
+    def set_attr(self, owner, name: str, value) -> None:
+        """Set an attribute and record the change."""
+        old = getattr(owner, name)
+        if old == value:
+            return
+        setattr(owner, name, value)
+        _invalidate_derived(owner, name, old, value)
+        self._record(owner, name, False, old, value)
+
+    def set_item(self, owner: dict, key, value) -> None:
+        """Set a dictionary entry and record the change."""
+        old = owner.get(key, _MISSING)
+        if old is not _MISSING and old == value:
+            return
+        owner[key] = value
+        self._record(owner, key, True, old, value)
+
+    def delete_item(self, owner: dict, key) -> None:
+        """Delete a dictionary entry and record the change."""
+        if key not in owner:
+            return
+        old = owner.pop(key)
+        self._record(owner, key, True, old, _MISSING)
+
+    def undo(self) -> Optional[str]:
+        """Undo the last action.  Returns its label."""
+        if not self._undo:
+            return None
+        action = self._undo.pop()
+        action.undo()
+        for owner, field, is_key, old, _new in reversed(action.changes):
+            self._notify(owner, field, is_key, old)
+        self._redo.append(action)
+        log.debug(f"Undid '{action.label}'.")
+        return action.label
+
+    def redo(self) -> Optional[str]:
+        """Redo the last undone action.  Returns its label."""
+        if not self._redo:
+            return None
+        action = self._redo.pop()
+        action.redo()
+        for owner, field, is_key, _old, new in action.changes:
+            self._notify(owner, field, is_key, new)
+        self._undo.append(action)
+        log.debug(f"Redid '{action.label}'.")
+        return action.label
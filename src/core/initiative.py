@@ -0,0 +1,149 @@
+# src/core/initiative.py
+import bisect
+import itertools
+import random
+from typing import Dict, List, Optional, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.initiative")
+
+
+class InitiativeTracker:
+    """
+    Turn order for an encounter.
+
+    Combatants are kept in a list sorted by a key of (initiative, dexterity, roll-off),
+    highest first, so inserting or removing a combatant is a binary search plus a single
+    list insert/delete; the order is never re-sorted.  The acting combatant is tracked by
+    index, so 'current' and 'next' are O(1).  If the acting combatant leaves mid-turn, the
+    turn slot is left vacant: current is None until next_turn moves on to their successor.
+
+    Delaying removes the acting combatant from the order until resume is called, which
+    places them directly after whoever is acting at that point.  Readied actions are
+    tracked until used or until the readying combatant's next turn begins.
+    """
+
+    def __init__(self, roll_off_sides: int = 20) -> None:
+        self._keys: List[Tuple] = []
+        self._ids: List[str] = []
+        self._key_of: Dict[str, Tuple] = {}
+        self._seq = itertools.count(1)
+        self._roll_off_sides = roll_off_sides
+        self._current = -1
+        self._vacated = False  # The acting combatant left; _current points at their predecessor
+        self.round = 0
+        self.delayed: Dict[str, Tuple] = {}
+        self.readied: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, combatant_id: str) -> bool:
+        return combatant_id in self._key_of
+
+    def order(self) -> List[str]:
+        """Combatant IDs in turn order."""
+        return list(self._ids)
+
+    def _insert(self, combatant_id: str, key: Tuple) -> None:
+        index = bisect.bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._ids.insert(index, combatant_id)
+        self._key_of[combatant_id] = key
+        if 0 <= index <= self._current:
+            self._current += 1
+
+    def _remove(self, combatant_id: str) -> Tuple:
+        key = self._key_of.pop(combatant_id)
+        index = bisect.bisect_left(self._keys, key)
+        del self._keys[index]
+        del self._ids[index]
+        # If the acting combatant leaves, step back so next_turn lands on whoever followed them.
+        if index == self._current and not self._vacated:
+            self._vacated = True
+            self._current -= 1
+        elif index <= self._current:
+            self._current -= 1
+        return key
+
+    def add(self, combatant_id: str, initiative: int, dexterity: int = 10) -> None:
+        """
+        Add a combatant, at the start of or during combat.
+
+        Args:
+            combatant_id (str):     Unique ID of the combatant.
+            initiative (int):       Initiative roll total.
+            dexterity (int):        Dexterity score, the first tie-breaker.  A roll-off is the second.
+        """
+        if combatant_id in self._key_of or combatant_id in self.delayed:
+            log.warning(f"Combatant '{combatant_id}' is already in the initiative order.")
+            return
+        roll_off = random.randint(1, self._roll_off_sides)
+        # Keys sort ascending, so negate to put the highest values first.
+        self._insert(combatant_id, (-initiative, -dexterity, -roll_off, next(self._seq)))
+
+    def remove(self, combatant_id: str) -> bool:
+        """Remove a combatant, e.g. when a monster dies or flees."""
+        self.readied.pop(combatant_id, None)
+        if self.delayed.pop(combatant_id, None) is not None:
+            return True
+        if combatant_id not in self._key_of:
+            return False
+        self._remove(combatant_id)
+        return True
+
+    def current(self) -> Optional[str]:
+        """Combatant whose turn it is.  None before combat or after the acting combatant left."""
+        if not self._vacated and 0 <= self._current < len(self._ids):
+            return self._ids[self._current]
+        return None
+
+    def peek_next(self) -> Optional[str]:
+        """Combatant who acts after the current one."""
+        if not self._ids:
+            return None
+        return self._ids[(self._current + 1) % len(self._ids)]
+
+    def next_turn(self) -> Optional[str]:
+        """Advance to the next combatant, starting a new round when the order wraps."""
+        if not self._ids:
+            return None
+        self._vacated = False
+        self._current += 1
+        if self._current >= len(self._ids):
+            self._current = 0
+            self.round += 1
+        elif self.round == 0:
+            self.round = 1
+        combatant_id = self._ids[self._current]
+        self.readied.pop(combatant_id, None)  # A readied action lasts until the next turn
+        return combatant_id
+
+    def delay(self, combatant_id: Optional[str] = None) -> bool:
+        """Take the acting combatant (by default) out of the order until they resume."""
+        combatant_id = combatant_id or self.current()
+        if combatant_id not in self._key_of:
+            return False
+        self.delayed[combatant_id] = self._remove(combatant_id)
+        return True
+
+    def resume(self, combatant_id: str) -> bool:
+        """Bring a delaying combatant back in, acting directly after the current combatant."""
+        if combatant_id not in self.delayed:
+            return False
+        del self.delayed[combatant_id]
+        # While the turn slot is vacant, resume after the combatant who acted before it.
+        current = self._ids[self._current] if 0 <= self._current < len(self._ids) else None
+        anchor = self._key_of[current] if current is not None else (float("-inf"),)
+        # Extending the anchor key sorts directly after it; a decreasing suffix makes the
+        # most recent resume go first if several resume during the same turn.
+        self._insert(combatant_id, anchor + (-next(self._seq),))
+        return True
+
+    def ready(self, combatant_id: str, trigger: str) -> None:
+        """Hold a readied action until its trigger occurs or the combatant's next turn begins."""
+        self.readied[combatant_id] = trigger
+
+    def trigger_ready(self, combatant_id: str) -> Optional[str]:
+        """Use a readied action.  Returns the trigger it was readied for, if any."""
+        return self.readied.pop(combatant_id, None)
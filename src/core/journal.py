@@ -0,0 +1,197 @@
+# src/core/journal.py
+import json
+import os
+import threading
+import zlib
+from typing import Any, List, Optional
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.journal")
+
+
+def apply_record(state: dict, op: str, path: List[str], value: Any = None) -> None:
+    """
+    Apply one state change to a nested dictionary.
+
+    Args:
+        state (dict):       State to change.
+        op (str):           'set' a value, 'add' to a number, or 'del' a key.
+        path (List[str]):   Keys leading to the changed value, e.g. ['combatants', 'g1', 'current_hp'].
+        value (Any):        New value, or amount to add.
+    """
+    node = state
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    key = path[-1]
+    if op == "set":
+        node[key] = value
+    elif op == "add":
+        node[key] = node.get(key, 0) + value
+    elif op == "del":
+        node.pop(key, None)
+    else:
+        raise ValueError(f"Unknown journal operation '{op}'.")
+
+
+class Journal:
+    """
+    Append-only, checksummed journal of state changes for an encounter or session.
+
+    State lives in two files next to 'base_path': a JSON snapshot and a journal of
+    changes made since the snapshot, one line per change:
+
+        <crc32 of record> {"s": <sequence>, "o": <op>, "p": <path>, "v": <value>}
+
+    Every record is flushed to the OS as it is written, so it survives a crash of the
+    process; fsync is batched (every 'sync_every' records, or 'sync_interval' seconds after
+    the first unsynced one), so saving after every action costs a short sequential append.
+    On open, the snapshot is loaded and the journal replayed up to the first torn or corrupt
+    record.  compact folds the journal into a new snapshot; it can run periodically on a
+    background thread once the journal grows past 'compact_bytes'.
+    """
+
+    def __init__(self, base_path: str, sync_every: int = 32, sync_interval: float = 1.0,
+                 compact_bytes: int = 1 << 20) -> None:
+        self.snapshot_path = f"{base_path}.snapshot.json"
+        self.journal_path = f"{base_path}.journal"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_bytes = compact_bytes
+        self.state: dict = {}
+        self._sequence = 0
+        self._file = None
+        self._unsynced = 0
+        self._sync_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+    def open(self) -> dict:
+        """Recover state from the snapshot and journal, then open the journal for appending."""
+        with self._lock:
+            self._recover()
+            self._file = open(self.journal_path, "ab")
+        return self.state
+
+    def _recover(self) -> None:
+        self.state, self._sequence = {}, 0
+        if os.path.isfile(self.snapshot_path):
+            with open(self.snapshot_path, "r") as f:
+                snapshot = json.load(f)
+            self.state = snapshot.get("state", {})
+            self._sequence = snapshot.get("sequence", 0)
+
+        if not os.path.isfile(self.journal_path):
+            return
+        replayed = 0
+        good_length = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                record = self._decode(line)
+                if record is None:
+                    log.warning(f"Journal '{self.journal_path}' has a damaged record; discarding it and everything after it.")
+                    break
+                good_length += len(line)
+                # Records already folded into the snapshot (compaction interrupted before truncation).
+                if record["s"] <= self._sequence:
+                    continue
+                apply_record(self.state, record["o"], record["p"], record.get("v"))
+                self._sequence = record["s"]
+                replayed += 1
+        if good_length != os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_length)
+        log.info(f"Recovered '{self.journal_path}': replayed {replayed} record(s).")
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[dict]:
+        if not line.endswith(b"\n"):
+            return None  # Torn write
+        checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def record(self, op: str, path: List[str], value: Any = None) -> None:
+        """Apply a state change and append it to the journal, opening it first if needed."""
+        with self._lock:
+            if self._file is None:
+                self.open()
+            apply_record(self.state, op, path, value)
+            self._sequence += 1
+            entry = {"s": self._sequence, "o": op, "p": path}
+            if op != "del":
+                entry["v"] = value
+            payload = json.dumps(entry, separators=(",", ":")).encode("utf-8")
+            self._file.write(b"%08x %s\n" % (zlib.crc32(payload), payload))
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every:
+                self.sync()
+            elif self._sync_timer is None:
+                # An idle period after a burst still gets its records fsync'd.
+                self._sync_timer = threading.Timer(self.sync_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def sync(self) -> None:
+        """fsync the journal."""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is None or not self._unsynced:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def compact(self) -> None:
+        """Write the current state as a new snapshot and empty the journal."""
+        with self._lock:
+            self.sync()
+            temp_path = f"{self.snapshot_path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"sequence": self._sequence, "state": self.state}, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            if self._file is not None:
+                self._file.truncate(0)
+                self._file.seek(0)
+            log.debug(f"Compacted '{self.journal_path}' into snapshot at record {self._sequence}.")
+
+    def journal_size(self) -> int:
+        with self._lock:
+            if self._file is not None:
+                return self._file.tell()
+        return os.path.getsize(self.journal_path) if os.path.isfile(self.journal_path) else 0
+
+    def start_compaction(self, interval: float = 30.0) -> None:
+        """Compact in the background whenever the journal exceeds 'compact_bytes'."""
+        if self._compactor is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                if self.journal_size() >= self.compact_bytes:
+                    self.compact()
+
+        self._stop.clear()
+        self._compactor = threading.Thread(target=run, name="journal-compaction", daemon=True)
+        self._compactor.start()
+
+    def close(self) -> None:
+        """Stop background compaction, sync and close the journal."""
+        self._stop.set()
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        with self._lock:
+            if self._file is not None:
+                self.sync()
+                self._file.close()
+                self._file = None
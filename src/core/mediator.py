@@ -1,19 +1,174 @@
-from typing import Callable, Dict
+import asyncio
+import inspect
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from src.core.config import ConfigLoader
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.mediator")
+
+
+class _Handler:
+    __slots__ = ("callback", "priority", "order", "batched")
+
+    def __init__(self, callback: Callable, priority: int, order: int, batched: bool):
+        self.callback = callback
+        self.priority = priority
+        self.order = order
+        self.batched = batched
+
 
 class Mediator:
+    """
+    Routes events between subsystems.
+
+    Several handlers can listen for an event; they run highest priority first, then in
+    registration order.  notify calls every handler, request returns the first answer.
+    post queues an event for the next flush, where handlers registered as 'batched' get
+    each run of consecutive queued calls of their event at once.  Coroutine handlers can be dispatched with
+    notify_async (awaited concurrently) or post_async (on a background event loop, so the
+    caller never blocks).  Dispatch time is recorded per event; see metrics.
+    """
+
     def __init__(self, config_loader: ConfigLoader):
         self.config_loader = config_loader
-        self._handlers: Dict[str, Callable] = {}
-
-    def register_handler(self, event: str, handler: Callable):
-        """Register a handler for a specific event."""
-        self._handlers[event] = handler
-
-    def notify(self, event: str, *args, **kwargs):
-        """Notify the handler for the given event."""
-        handler = self._handlers.get(event)
-        if handler:
-            handler(*args, **kwargs)
-        else:
-            raise ValueError(f"No handler registered for event: {event}")
\ No newline at end of file
+        self._handlers: Dict[str, List[_Handler]] = {}
+        self._order = itertools.count()
+        self._queue: List[Tuple[str, tuple, dict]] = []
+        self._metrics: Dict[str, List[float]] = {}  # Event -> [count, total seconds, max seconds]
+        self._metrics_lock = threading.Lock()  # post_async records from the event loop thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    def register_handler(self, event: str, handler: Callable, priority: int = 0, batched: bool = False):
+        """
+        Register a handler for a specific event.
+
+        Args:
+            event (str):            Event name.
+            handler (Callable):     Function or coroutine function called with the event's arguments.
+            priority (int):         Higher priorities run first.
+            batched (bool):         Deliver posted events once per flush, as a list of (args, kwargs).
+        """
+        handlers = self._handlers.setdefault(event, [])
+        handlers.append(_Handler(handler, priority, next(self._order), batched))
+        handlers.sort(key=lambda entry: (-entry.priority, entry.order))
+
+    def unregister_handler(self, event: str, handler: Callable):
+        handlers = self._handlers.get(event, [])
+        handlers[:] = [entry for entry in handlers if entry.callback != handler]
+
+    def _get_handlers(self, event: str) -> List[_Handler]:
+        handlers = self._handlers.get(event)
+        if not handlers:
+            raise ValueError(f"No handler registered for event: {event}")
+        return list(handlers)
+
+    def _record(self, event: str, started: float):
+        elapsed = time.perf_counter() - started
+        with self._metrics_lock:
+            stats = self._metrics.setdefault(event, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def notify(self, event: str, *args, **kwargs) -> List[Any]:
+        """Notify every handler for the given event.  Returns their results in call order."""
+        started = time.perf_counter()
+        try:
+            return [entry.callback(*args, **kwargs) for entry in self._get_handlers(event)]
+        finally:
+            self._record(event, started)
+
+    def request(self, event: str, *args, **kwargs) -> Any:
+        """Ask the handlers for an answer: the first result that isn't None, in priority order."""
+        started = time.perf_counter()
+        try:
+            for entry in self._get_handlers(event):
+                result = entry.callback(*args, **kwargs)
+                if result is not None:
+                    return result
+            return None
+        finally:
+            self._record(event, started)
+
+    def post(self, event: str, *args, **kwargs):
+        """Queue an event for the next flush."""
+        self._queue.append((event, args, kwargs))
+
+    def flush(self) -> int:
+        """
+        Deliver queued events in the order they were posted.  A run of consecutive posts of
+        the same event is delivered together: batched handlers get one call with every
+        (args, kwargs) of the run.  A failing handler is logged and doesn't stop the others.
+
+        Returns:
+            int:    Number of events delivered.
+        """
+        queued, self._queue = self._queue, []
+        runs: List[Tuple[str, List[Tuple[tuple, dict]]]] = []
+        for event, args, kwargs in queued:
+            if runs and runs[-1][0] == event:
+                runs[-1][1].append((args, kwargs))
+            else:
+                runs.append((event, [(args, kwargs)]))
+        for event, calls in runs:
+            handlers = self._handlers.get(event)
+            if not handlers:
+                log.warning(f"No handler registered for posted event: {event}")
+                continue
+            started = time.perf_counter()
+            for entry in list(handlers):
+                try:
+                    if entry.batched:
+                        entry.callback(calls)
+                    else:
+                        for args, kwargs in calls:
+                            entry.callback(*args, **kwargs)
+                except Exception as e:
+                    log.error(f"Handler for '{event}' failed: {e!r}")
+            self._record(event, started)
+        return len(queued)
+
+    async def notify_async(self, event: str, *args, **kwargs) -> List[Any]:
+        """Notify every handler, awaiting coroutine handlers concurrently.  Returns their results."""
+        started = time.perf_counter()
+        try:
+            results: List[Any] = []
+            waiting = []
+            for entry in self._get_handlers(event):
+                result = entry.callback(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    waiting.append((len(results), result))
+                results.append(result)
+            for (position, _), value in zip(waiting, await asyncio.gather(*(awaitable for _, awaitable in waiting))):
+                results[position] = value
+            return results
+        finally:
+            self._record(event, started)
+
+    def post_async(self, event: str, *args, **kwargs) -> Future:
+        """Run notify_async on the mediator's background event loop.  Returns a Future of the results."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name="mediator-async", daemon=True)
+            self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(self.notify_async(event, *args, **kwargs), self._loop)
+
+    def metrics(self) -> Dict[str, dict]:
+        """Dispatch count, mean and worst latency (ms) per event."""
+        with self._metrics_lock:
+            return {event: {"count": count, "mean_ms": total / count * 1000, "max_ms": worst * 1000}
+                    for event, (count, total, worst) in self._metrics.items()}
+
+    def close(self):
+        """Stop the background event loop."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
@@ -1,10 +1,140 @@
 # src/core/observer.py
-from typing import List, Optional
+import inspect
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 from src.utils.logger import setup_logger
 
 log = setup_logger("DMBuddy.observer")
 
+
+class EventType:
+    """Game events published on the event bus."""
+    TURN_BEGIN = "turn_begin"
+    TURN_END = "turn_end"
+    DAMAGE = "damage"
+    SAVE_SUCCEEDED = "save_succeeded"
+    ITEM_UNEQUIPPED = "item_unequipped"
+
+
 class Observer:
-    
+
+    __slots__ = ("__weakref__",)
+
     def update(self, event: str, data: Optional[dict] = None) -> None:
-        pass
\ No newline at end of file
+        pass
+
+
+Subscriber = Union[Observer, Callable[[str, Optional[dict]], None]]
+
+
+class EventBus:
+    """
+    Publish/subscribe hub for game events.
+
+    Subscribers are indexed by event and, optionally, by the source entity they care about
+    (e.g. the creature an effect is applied to), so publishing an event only visits the
+    subscribers interested in it.  Subscribers are held through weak references: when a
+    creature or effect is garbage collected its subscriptions disappear with it.
+
+    Subscribers are Observer instances (called through update) or bound methods/functions
+    taking (event, data).  Note that a lambda with no other reference is collected at once.
+    """
+
+    def __init__(self) -> None:
+        # event -> source (None for every source) -> subscriber key -> weak reference
+        self._subscribers: Dict[str, Dict[Optional[Hashable], Dict[Tuple[int, int], weakref.ref]]] = {}
+        self._queue: List[Tuple[str, Optional[dict], Optional[Hashable]]] = []
+        self._batch_depth = 0
+
+    @staticmethod
+    def _key(subscriber: Subscriber) -> Tuple[int, int]:
+        if inspect.ismethod(subscriber):
+            return id(subscriber.__self__), id(subscriber.__func__)
+        return id(subscriber), 0
+
+    def subscribe(self, event: str, subscriber: Subscriber, source: Optional[Hashable] = None) -> None:
+        """
+        Register a subscriber for an event.
+
+        Args:
+            event (str):                Event to listen for.
+            subscriber:                 Observer, bound method or function.
+            source (Hashable):          Optional.  Only receive events published for this source.
+        """
+        bucket = self._subscribers.setdefault(event, {}).setdefault(source, {})
+        key = self._key(subscriber)
+
+        def _discard(_ref, bucket=bucket, key=key):
+            bucket.pop(key, None)
+
+        if inspect.ismethod(subscriber):
+            bucket[key] = weakref.WeakMethod(subscriber, _discard)
+        else:
+            bucket[key] = weakref.ref(subscriber, _discard)
+
+    def unsubscribe(self, event: str, subscriber: Subscriber, source: Optional[Hashable] = None) -> None:
+        """Remove a subscription made with subscribe."""
+        bucket = self._subscribers.get(event, {}).get(source)
+        if bucket is not None:
+            bucket.pop(self._key(subscriber), None)
+
+    def subscriber_count(self, event: str) -> int:
+        return sum(len(bucket) for bucket in self._subscribers.get(event, {}).values())
+
+    def publish(self, event: str, data: Optional[dict] = None, source: Optional[Hashable] = None) -> None:
+        """
+        Publish an event.  Inside a batch the event is queued until the batch ends.
+
+        Args:
+            event (str):                Event being published.
+            data (dict):                Optional.  Event details passed to subscribers.
+            source (Hashable):          Optional.  Entity the event concerns.
+        """
+        if self._batch_depth:
+            self._queue.append((event, data, source))
+        else:
+            self._dispatch(event, data, source)
+
+    @contextmanager
+    def batch(self) -> Iterator["EventBus"]:
+        """Queue every event published during one action and deliver them together at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> int:
+        """Deliver all queued events in the order they were published."""
+        delivered = 0
+        while self._queue:
+            queue, self._queue = self._queue, []
+            for event, data, source in queue:
+                self._dispatch(event, data, source)
+                delivered += 1
+        return delivered
+
+    def _dispatch(self, event: str, data: Optional[dict], source: Optional[Hashable]) -> None:
+        by_source = self._subscribers.get(event)
+        if not by_source:
+            return
+        buckets = [by_source.get(None)]
+        if source is not None:
+            buckets.append(by_source.get(source))
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for ref in list(bucket.values()):
+                subscriber = ref()
+                if subscriber is None:
+                    continue
+                try:
+                    if isinstance(subscriber, Observer):
+                        subscriber.update(event, data)
+                    else:
+                        subscriber(event, data)
+                except Exception as e:
+                    log.error(f"Subscriber {subscriber!r} failed handling '{event}': {e}")
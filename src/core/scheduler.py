@@ -0,0 +1,149 @@
+# src/core/scheduler.py
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.scheduler")
+
+
+class _Entry:
+    """Bookkeeping for one scheduled effect."""
+
+    __slots__ = ("effect", "target", "key", "expiry", "item_id", "cancelled")
+
+    def __init__(self, effect, target: str, key: Optional[Tuple[str, str]] = None,
+                 expiry: int = 0, item_id: Optional[str] = None) -> None:
+        self.effect = effect
+        self.target = target
+        self.key = key
+        self.expiry = expiry
+        self.item_id = item_id
+        self.cancelled = False
+
+
+class EffectScheduler:
+    """
+    Encounter-level scheduler for effect durations.
+
+    Turn-based effects are filed under the turn boundary that counts them down, keyed by
+    (turn owner, trigger), in a min-heap ordered by the boundary count at which they
+    expire.  Passing a boundary only looks at the effects filed under it and pops the ones
+    that are due, so a turn change costs O(due effects), not O(active effects).
+
+    Effects lasting 'until_save' or 'while_equipped' are indexed by target and item and
+    are ended through the save_succeeded and item_unequipped hooks.  Every method that ends
+    effects returns them, so the owner (see Encounter) can take them off their creatures.
+    """
+
+    def __init__(self) -> None:
+        self._seq = itertools.count()  # Tie-breaker so heap entries never compare effects
+        self._boundaries: Dict[Tuple[str, str], int] = {}  # Boundaries passed per (owner, trigger)
+        self._wheel: Dict[Tuple[str, str], List[Tuple[int, int, _Entry]]] = {}
+        self._entries: Dict[int, _Entry] = {}  # Keyed by id(effect)
+        self._until_save: Dict[str, Dict[int, _Entry]] = {}  # Target -> entries
+        self._while_equipped: Dict[str, Dict[int, _Entry]] = {}  # Item ID -> entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, effect) -> bool:
+        return id(effect) in self._entries
+
+    def schedule(self, effect, target: str, source: Optional[str] = None, item_id: Optional[str] = None) -> bool:
+        """
+        Start tracking the duration of an effect.
+
+        Args:
+            effect (Effect):    Effect to track.
+            target (str):       Combatant ID of the creature the effect is applied to.
+            source (str):       Optional.  Combatant ID of the creature that caused the effect.
+            item_id (str):      Optional.  Item that grants the effect, for 'while_equipped'.
+
+        Returns:
+            bool:               True if the effect has a duration that is now being tracked.
+        """
+        if id(effect) in self._entries:
+            log.warning(f"Effect '{effect.effect_type}' on '{target}' is already scheduled.")
+            return False
+
+        if effect.duration == "turn_based":
+            owner = source if effect.duration_trigger_source == "effect_source" and source else target
+            key = (owner, effect.duration_trigger)
+            expiry = self._boundaries.get(key, 0) + effect.duration_value
+            entry = _Entry(effect, target, key, expiry)
+            heapq.heappush(self._wheel.setdefault(key, []), (expiry, next(self._seq), entry))
+        elif effect.duration == "until_save":
+            entry = _Entry(effect, target)
+            self._until_save.setdefault(target, {})[id(effect)] = entry
+        elif effect.duration == "while_equipped":
+            if item_id is None:
+                log.warning(f"Effect '{effect.effect_type}' lasts while equipped, but no item was given.  Not scheduled.")
+                return False
+            entry = _Entry(effect, target, item_id=item_id)
+            self._while_equipped.setdefault(item_id, {})[id(effect)] = entry
+        else:
+            # Instant and permanent effects have nothing to count down.
+            return False
+
+        self._entries[id(effect)] = entry
+        return True
+
+    def cancel(self, effect) -> bool:
+        """Stop tracking an effect, e.g. when it is dispelled."""
+        entry = self._entries.pop(id(effect), None)
+        if entry is None:
+            return False
+        entry.cancelled = True  # Heap entries are dropped lazily when they come due
+        self._until_save.get(entry.target, {}).pop(id(effect), None)
+        if entry.item_id is not None:
+            self._while_equipped.get(entry.item_id, {}).pop(id(effect), None)
+        return True
+
+    def remaining(self, effect) -> Optional[int]:
+        """Number of turn boundaries left for a turn-based effect."""
+        entry = self._entries.get(id(effect))
+        if entry is None or entry.key is None:
+            return None
+        return entry.expiry - self._boundaries.get(entry.key, 0)
+
+    def _advance(self, owner: str, trigger: str) -> List:
+        key = (owner, trigger)
+        count = self._boundaries.get(key, 0) + 1
+        self._boundaries[key] = count
+        heap = self._wheel.get(key)
+        expired = []
+        while heap and heap[0][0] <= count:
+            entry = heapq.heappop(heap)[2]
+            if entry.cancelled:
+                continue
+            del self._entries[id(entry.effect)]
+            expired.append(entry.effect)
+        if expired:
+            log.debug(f"{len(expired)} effect(s) expired at {trigger} for '{owner}'.")
+        return expired
+
+    def begin_turn(self, owner: str) -> List:
+        """Pass the beginning of a combatant's turn and return the effects that expire."""
+        return self._advance(owner, "beginning_of_turn")
+
+    def end_turn(self, owner: str) -> List:
+        """Pass the end of a combatant's turn and return the effects that expire."""
+        return self._advance(owner, "end_of_turn")
+
+    def pending_saves(self, target: str) -> List:
+        """Effects on a target that end on a successful saving throw."""
+        return [entry.effect for entry in self._until_save.get(target, {}).values()]
+
+    def save_succeeded(self, target: str, effect=None) -> List:
+        """Hook for a successful save: end one (or every) 'until_save' effect on the target."""
+        entries = self._until_save.get(target, {})
+        effects = [effect] if effect is not None else [entry.effect for entry in entries.values()]
+        return [ended for ended in effects if id(ended) in entries and self.cancel(ended)]
+
+    def item_unequipped(self, item_id: str) -> List:
+        """Hook for unequipping an item: end every effect it granted."""
+        effects = [entry.effect for entry in self._while_equipped.pop(item_id, {}).values()]
+        for effect in effects:
+            self.cancel(effect)
+        return effects
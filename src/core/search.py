@@ -0,0 +1,239 @@
+# src/core/search.py
+import bisect
+import json
+import math
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from src.core.campaign import MANIFEST_NAME
+from src.utils.logger import setup_logger
+from src.utils.manifest import unchanged
+
+log = setup_logger("DMBuddy.search")
+
+INDEX_NAME = "search_index.json"
+INDEX_VERSION = 1
+SNIPPET_LENGTH = 200
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _string_fields(data, path: str = "") -> Iterator[Tuple[str, str]]:
+    """Every string in a JSON document with its path, e.g. ('encounters/encounter_01/title', '...')."""
+    if isinstance(data, str):
+        yield path, data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from _string_fields(value, f"{path}/{key}" if path else str(key))
+    elif isinstance(data, list):
+        for position, value in enumerate(data):
+            yield from _string_fields(value, f"{path}/{position}" if path else str(position))
+
+
+class SearchIndex:
+    """
+    Incremental full-text index over every string field in a campaign.
+
+    Each string field of each JSON file (campaign file, sessions, encounters and anything
+    else in the campaign directory) is one document.  The index maps every term to the
+    documents containing it and the term's positions in each, which answers phrase queries
+    without reading the files again.  update re-indexes only files whose size or
+    modification time changed; the index is saved as search_index.json in the campaign
+    directory.
+
+    Query syntax: words must all match; "quoted words" must appear together in order; a
+    trailing * matches any word with that prefix (gobl*).  Results are ranked with BM25.
+    """
+
+    def __init__(self, campaign_file: str) -> None:
+        self.campaign_file = Path(campaign_file)
+        self.directory = self.campaign_file.with_suffix("")
+        self.index_path = self.directory / INDEX_NAME
+        self.postings: Dict[str, Dict[int, List[int]]] = {}  # Term -> document -> positions
+        self.documents: Dict[int, dict] = {}  # Document -> file, field, length, terms, text
+        self.files: Dict[str, dict] = {}  # File -> size, mtime, documents
+        self._next_id = 0
+        self._total_length = 0
+        self._sorted_terms: Optional[List[str]] = None  # For prefix queries; rebuilt after changes
+
+    def load(self) -> "SearchIndex":
+        """Read the saved index, if there is a compatible one."""
+        if not self.index_path.is_file():
+            return self
+        try:
+            with open(self.index_path, "r") as f:
+                saved = json.load(f)
+        except json.JSONDecodeError:
+            log.warning(f"Search index '{self.index_path}' not properly formatted.  Rebuilding.")
+            return self
+        if saved.get("version") != INDEX_VERSION:
+            return self
+        self.postings = {term: {int(doc): positions for doc, positions in docs.items()}
+                         for term, docs in saved["postings"].items()}
+        self.documents = {int(doc): details for doc, details in saved["documents"].items()}
+        self.files = saved["files"]
+        self._next_id = saved["next_id"]
+        self._total_length = sum(details["length"] for details in self.documents.values())
+        self._sorted_terms = None
+        return self
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "next_id": self._next_id, "files": self.files,
+                       "documents": self.documents, "postings": self.postings}, f, separators=(",", ":"))
+        os.replace(temp_path, self.index_path)
+
+    def _source_files(self) -> Dict[str, Path]:
+        files = {self.campaign_file.name: self.campaign_file} if self.campaign_file.is_file() else {}
+        if self.directory.is_dir():
+            for file_path in self.directory.rglob("*.json"):
+                if file_path.name not in (MANIFEST_NAME, INDEX_NAME):
+                    files[file_path.relative_to(self.campaign_file.parent).as_posix()] = file_path
+        return files
+
+    def update(self, save: bool = True) -> Tuple[int, int]:
+        """
+        Re-index changed files and drop deleted ones.
+
+        Returns:
+            Tuple[int, int]:    Number of files (re-)indexed and removed.
+        """
+        sources = self._source_files()
+        removed = [name for name in self.files if name not in sources]
+        for name in removed:
+            self._remove_file(name)
+        indexed = 0
+        for name, file_path in sources.items():
+            stat = file_path.stat()
+            known = self.files.get(name)
+            if unchanged(known, stat):
+                continue
+            if known:
+                self._remove_file(name)
+            self._add_file(name, file_path, stat)
+            indexed += 1
+        if indexed or removed:
+            self._sorted_terms = None
+            if save:
+                self.save()
+        log.debug(f"Search index updated: {indexed} file(s) indexed, {len(removed)} removed.")
+        return indexed, len(removed)
+
+    def _add_file(self, name: str, file_path: Path, stat: os.stat_result) -> None:
+        try:
+            with open(file_path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            log.warning(f"'{file_path}' not properly formatted.  Not indexed.")
+            data = None
+        documents = []
+        for field, text in _string_fields(data) if data is not None else ():
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            doc = self._next_id
+            self._next_id += 1
+            for position, token in enumerate(tokens):
+                self.postings.setdefault(token, {}).setdefault(doc, []).append(position)
+            self.documents[doc] = {"file": name, "field": field, "length": len(tokens),
+                                   "terms": sorted(set(tokens)), "text": text[:SNIPPET_LENGTH]}
+            self._total_length += len(tokens)
+            documents.append(doc)
+        self.files[name] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "documents": documents}
+
+    def _remove_file(self, name: str) -> None:
+        for doc in self.files.pop(name, {}).get("documents", []):
+            details = self.documents.pop(doc)
+            self._total_length -= details["length"]
+            for term in details["terms"]:
+                docs = self.postings.get(term)
+                if docs is not None:
+                    docs.pop(doc, None)
+                    if not docs:
+                        del self.postings[term]
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Indexed terms starting with a prefix."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "\uffff")
+        return self._sorted_terms[start:end]
+
+    def _phrase_documents(self, terms: List[str]) -> Set[int]:
+        """Documents where the terms appear consecutively."""
+        postings = [self.postings.get(term, {}) for term in terms]
+        candidates = set(postings[0]).intersection(*postings[1:])
+        matches = set()
+        for doc in candidates:
+            following = [set(docs[doc]) for docs in postings[1:]]
+            if any(all(start + offset + 1 in positions for offset, positions in enumerate(following))
+                   for start in postings[0][doc]):
+                matches.add(doc)
+        return matches
+
+    def _bm25(self, term: str, doc: int) -> float:
+        docs = self.postings[term]
+        count = len(self.documents)
+        idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+        frequency = len(docs[doc])
+        average = self._total_length / count
+        length = self.documents[doc]["length"]
+        return idf * frequency * (_K1 + 1) / (frequency + _K1 * (1 - _B + _B * length / average))
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """
+        Find the fields matching a query.
+
+        Args:
+            query (str):    Words, "quoted phrases" and prefix* words.
+            limit (int):    Most results to return.
+
+        Returns:
+            List[dict]:     Best first, each with 'file', 'field', 'text' (truncated) and 'score'.
+        """
+        matched: Optional[Set[int]] = None
+        scoring: List[List[str]] = []  # Per query clause, the indexed terms it scores with
+        for phrase, word in _QUERY.findall(query):
+            if phrase:
+                terms = tokenize(phrase)
+                if not terms:
+                    continue
+                docs = self._phrase_documents(terms)
+                scoring.append(terms)
+            elif word.endswith("*"):
+                terms = self._expand("".join(tokenize(word[:-1])))
+                docs = set().union(*(self.postings[term] for term in terms)) if terms else set()
+                scoring.append(terms)
+            else:
+                terms = tokenize(word)
+                if not terms:
+                    continue
+                docs = self._phrase_documents(terms)  # A word like "half-orc" tokenizes to a phrase
+                scoring.append(terms)
+            matched = docs if matched is None else matched & docs
+            if not matched:
+                return []
+        if not matched:
+            return []
+
+        results = []
+        for doc in matched:
+            score = sum(self._bm25(term, doc) for terms in scoring for term in terms if doc in self.postings.get(term, {}))
+            details = self.documents[doc]
+            results.append({"file": details["file"], "field": details["field"], "text": details["text"],
+                            "score": score})
+        results.sort(key=lambda result: -result["score"])
+        return results[:limit]
@@ -1,5 +1,6 @@
 import tkinter as tk
 from src.core.mediator import Mediator
+from src.gui.tasks import TaskRunner
 from src.gui.theme import ThemeManager
 from src.gui.widgets import WidgetFactory
 
@@ -9,14 +10,21 @@ class AppGUI:
         self.theme_manager = theme_manager
         self.widget_factory = widget_factory
         self.root = tk.Tk()
+        self.tasks = TaskRunner(self.root)  # Slow work runs here, off the Tk thread
         self._setup_window()
 
     def _setup_window(self):
         """Configure the main window with theme and widgets."""
         self.theme_manager.apply_theme(self.root)
-        menu_config = self.mediator.notify("get_menu_config")
-        self.widget_factory.create_widgets(self.root, menu_config)
+        # The menu configuration is read and validated in the background.
+        self.tasks.submit(self.mediator.request, "get_menu_config", on_done=self._create_widgets)
+
+    def _create_widgets(self, menu_config: dict):
+        self.widget_factory.create_widgets(self.root, menu_config or {})
 
     def run(self):
         """Start the Tkinter main loop."""
-        self.root.mainloop()
\ No newline at end of file
+        try:
+            self.root.mainloop()
+        finally:
+            self.tasks.shutdown()
\ No newline at end of file
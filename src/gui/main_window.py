@@ -1,6 +1,7 @@
 # src/gui/main_window.py
 from src.utils.logger import setup_logger
 from src.utils.json_cache import JSONCache
+from src.gui.tasks import TaskRunner
 import tkinter as tk
 from pathlib import Path
 from typing import Callable, Optional
@@ -19,33 +20,37 @@ class MainWindow:
         self.log = setup_logger(__name__, jcache)
         self.root = root
         self.jcache = jcache
-        self.jcache.read(data_path)
-        if self.jcache.read(data_path):
-            self.log.info(f"Loaded JSON data from {data_path}")
-        else:
-            self.log.error(f"Failed to load JSON data from {data_path}")
+        self.tasks = TaskRunner(self.root)  # Slow work runs here, off the Tk thread
+        self.data_path = data_path
         self.root.title("DM Buddy")
         self.root.geometry("400x300")
-
-        self.load_buttons(data_path)
         self.create_exit_button()
 
-    def load_buttons(self, data_path):
-        button_data = self.jcache.read(data_path)
+        # Button configuration is read in the background; buttons appear once it arrives.
+        self.tasks.submit(self.jcache.read, data_path, on_done=self.load_buttons, on_error=self._load_failed)
+
+    def _load_failed(self, error: Exception):
+        self.log.error(f"Failed to load JSON data from {self.data_path}: {error}")
+
+    def load_buttons(self, button_data: Optional[dict]):
         if button_data:
-            buttons = button_data.get('buttons', {})
+            self.log.info(f"Loaded JSON data from {self.data_path}")
         else:
-            self.log.error(f"Failed to load button data from {data_path}")
-            buttons = {}
-        
+            self.log.error(f"Failed to load JSON data from {self.data_path}")
+        buttons = button_data.get('buttons', {}) if button_data else {}
+
         for label in buttons:
             btn = tk.Button(self.root, text=label, command=lambda x=label: self.on_button_click(x))
             btn.pack(pady=5)
 
     def create_exit_button(self):
-        exit_btn = tk.Button(self.root, text="Exit", command=self.root.quit)
+        exit_btn = tk.Button(self.root, text="Exit", command=self.close)
         exit_btn.pack(side=tk.BOTTOM, anchor=tk.SE, padx=10, pady=10)
 
+    def close(self):
+        self.tasks.shutdown()
+        self.root.quit()
+
     def on_button_click(self, button_name: str):
         # Placeholder for controller callback
         print(f"{button_name} clicked!")
\ No newline at end of file
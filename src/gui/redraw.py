@@ -0,0 +1,99 @@
+# src/gui/redraw.py
+import time
+import tkinter as tk
+import weakref
+from typing import Callable, Dict, Optional, Set
+from src.core.mediator import Mediator
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.redraw")
+
+# A view renders the options it wants on each of its widgets, e.g. {hp_label: {"text": "12/20"}}.
+Render = Callable[[], Dict[tk.Misc, dict]]
+
+
+class RedrawScheduler:
+    """
+    Coalesces widget updates into one repaint per frame.
+
+    Instead of updating widgets from every mediator notification, handlers mark views dirty.
+    Dirty views are collected in a set (so a view marked a hundred times renders once) and
+    flushed together by a single after_idle callback, or after the rest of the frame
+    ('frame_ms') if the last flush was more recent.  Each view renders the options it wants
+    on its widgets; only options that differ from what was last applied are configured.
+    """
+
+    def __init__(self, root: tk.Misc, frame_ms: int = 16) -> None:
+        self.root = root
+        self.frame_ms = frame_ms
+        self._views: Dict[str, Render] = {}
+        self._dirty: Set[str] = set()
+        # Widget -> options last configured.  Weak, so destroyed widgets aren't kept alive here.
+        self._applied: "weakref.WeakKeyDictionary[tk.Misc, dict]" = weakref.WeakKeyDictionary()
+        self._pending: Optional[str] = None
+        self._last_flush = 0.0
+        self.frames = 0
+        self.configures = 0
+
+    def register_view(self, name: str, render: Render) -> None:
+        self._views[name] = render
+
+    def unregister_view(self, name: str) -> None:
+        self._views.pop(name, None)
+        self._dirty.discard(name)
+
+    def watch(self, mediator: Mediator, event: str, *views: str) -> None:
+        """Mark views dirty whenever the mediator is notified of an event."""
+        mediator.register_handler(event, lambda *args, **kwargs: self.mark_dirty(*views))
+
+    def mark_dirty(self, *views: str) -> None:
+        """Queue views for the next frame."""
+        self._dirty.update(views)
+        if self._pending is None and self._dirty:
+            wait_ms = self.frame_ms - (time.monotonic() - self._last_flush) * 1000
+            if wait_ms > 0:
+                self._pending = self.root.after(int(wait_ms), self.flush)
+            else:
+                self._pending = self.root.after_idle(self.flush)
+
+    def flush(self) -> int:
+        """
+        Render every dirty view now.
+
+        Returns:
+            int:    Number of widgets reconfigured.
+        """
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+        dirty, self._dirty = self._dirty, set()
+        configured = 0
+        for name in dirty:
+            render = self._views.get(name)
+            if render is None:
+                continue
+            try:
+                wanted = render()
+            except Exception as e:
+                log.error(f"Rendering view '{name}' failed: {e!r}")
+                continue
+            for widget, options in wanted.items():
+                applied = self._applied.setdefault(widget, {})
+                changed = {option: value for option, value in options.items() if applied.get(option) != value}
+                if not changed:
+                    continue
+                try:
+                    widget.configure(**changed)
+                except tk.TclError:
+                    self._applied.pop(widget, None)  # Widget destroyed
+                    continue
+                applied.update(changed)
+                configured += 1
+        self._last_flush = time.monotonic()
+        self.frames += 1
+        self.configures += configured
+        return configured
+
+    def forget(self, widget: tk.Misc) -> None:
+        """Drop what was applied to a widget, e.g. when it's destroyed or restyled elsewhere."""
+        self._applied.pop(widget, None)
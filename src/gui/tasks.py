@@ -0,0 +1,128 @@
+# src/gui/tasks.py
+import itertools
+import queue
+import tkinter as tk
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.tasks")
+
+
+class Task:
+    """Handle for work submitted to a TaskRunner."""
+
+    __slots__ = ("id", "key", "future", "on_done", "on_error", "cancelled")
+
+    def __init__(self, task_id: int, key: Optional[Hashable], future: Future,
+                 on_done: Optional[Callable], on_error: Optional[Callable]) -> None:
+        self.id = task_id
+        self.key = key
+        self.future = future
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> None:
+        """Stop the work if it hasn't started, and never deliver its result either way."""
+        self.cancelled = True
+        self.future.cancel()
+
+
+class TaskRunner:
+    """
+    Runs slow work off the Tk thread and delivers results back on it.
+
+    Work goes to a thread pool (or a process pool, for CPU-bound work with picklable
+    arguments).  Finished tasks are put on a completion queue that the Tk thread drains
+    with root.after polling, so on_done and on_error callbacks can touch widgets safely.
+    Polling only runs while tasks are outstanding.
+
+    Tasks submitted with a key coalesce: a new task cancels the pending one with the same
+    key, so repeated requests such as search-as-you-type only deliver the latest result.
+    """
+
+    def __init__(self, root: tk.Misc, max_workers: int = 4, use_processes: bool = False,
+                 poll_ms: int = 30) -> None:
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor: Executor = (ProcessPoolExecutor if use_processes else ThreadPoolExecutor)(max_workers)
+        self._completed: "queue.SimpleQueue[Task]" = queue.SimpleQueue()
+        self._outstanding: Dict[int, Task] = {}
+        self._latest: Dict[Hashable, Task] = {}
+        self._ids = itertools.count()
+        self._polling: Optional[str] = None
+
+    def submit(self, fn: Callable, *args, on_done: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, key: Optional[Hashable] = None, **kwargs) -> Task:
+        """
+        Run fn(*args, **kwargs) in the pool.  Call from the Tk thread.
+
+        Args:
+            fn (Callable):          Work to run.
+            on_done (Callable):     Optional.  Called with the result, on the Tk thread.
+            on_error (Callable):    Optional.  Called with the exception, on the Tk thread.  Errors
+                                    without a handler are logged.
+            key (Hashable):         Optional.  Cancel any pending task with the same key.
+
+        Returns:
+            Task:                   Handle to cancel the task or check on it.
+        """
+        if key is not None and key in self._latest:
+            self._latest[key].cancel()
+        future = self._executor.submit(fn, *args, **kwargs)
+        task = Task(next(self._ids), key, future, on_done, on_error)
+        self._outstanding[task.id] = task
+        if key is not None:
+            self._latest[key] = task
+        future.add_done_callback(lambda _future, task=task: self._completed.put(task))
+        if self._polling is None:
+            self._polling = self.root.after(self.poll_ms, self._poll)
+        return task
+
+    def _poll(self) -> None:
+        self._polling = None
+        while True:
+            try:
+                task = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(task)
+        if self._outstanding:
+            self._polling = self.root.after(self.poll_ms, self._poll)
+
+    def _deliver(self, task: Task) -> None:
+        self._outstanding.pop(task.id, None)
+        if task.key is not None and self._latest.get(task.key) is task:
+            del self._latest[task.key]
+        if task.cancelled or task.future.cancelled():
+            return
+        error = task.future.exception()
+        try:
+            if error is None:
+                if task.on_done is not None:
+                    task.on_done(task.future.result())
+            elif task.on_error is not None:
+                task.on_error(error)
+            else:
+                log.error(f"Background task {task.id} failed: {error!r}")
+        except Exception as e:
+            log.error(f"Callback for background task {task.id} failed: {e!r}")
+
+    def pending(self) -> int:
+        return len(self._outstanding)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel everything not yet started and stop the pool."""
+        for task in list(self._outstanding.values()):
+            task.cancel()
+        self._outstanding.clear()
+        self._latest.clear()
+        if self._polling is not None:
+            self.root.after_cancel(self._polling)
+            self._polling = None
+        self._executor.shutdown(wait=wait, cancel_futures=True)
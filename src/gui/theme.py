@@ -1,12 +1,152 @@
+# src/gui/theme.py
+import json
+import os
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Optional
 from src.core.config import ConfigLoader
+from src.utils.logger import setup_logger
+from src.utils.manifest import file_hash, hash_bytes
+
+log = setup_logger("DMBuddy.theme")
+
+# Theme file section -> Tk widget class it styles.
+WIDGET_CLASSES = {
+    "window": "Tk", "toplevel": "Toplevel", "frame": "Frame", "button": "Button", "label": "Label",
+    "entry": "Entry", "text": "Text", "listbox": "Listbox", "canvas": "Canvas",
+    "checkbutton": "Checkbutton", "radiobutton": "Radiobutton", "scale": "Scale", "menu": "Menu",
+}
+
+# Short option names used in theme files -> full Tk option names, as configure takes them.
+OPTION_NAMES = {"bg": "background", "fg": "foreground", "bd": "borderwidth",
+                "activebg": "activebackground", "activefg": "activeforeground"}
+
+# Tk option names whose option database name differs (the database is case-sensitive).
+_DATABASE_NAMES = {
+    "borderwidth": "borderWidth", "activebackground": "activeBackground", "activeforeground": "activeForeground",
+    "disabledforeground": "disabledForeground", "highlightbackground": "highlightBackground",
+    "highlightcolor": "highlightColor", "highlightthickness": "highlightThickness",
+    "insertbackground": "insertBackground", "selectbackground": "selectBackground",
+    "selectforeground": "selectForeground", "selectcolor": "selectColor", "troughcolor": "troughColor",
+}
+
+COMPILED_VERSION = 2  # Part of the cache key; bump when the compiled format changes
+
+# Classes that take the window background unless the theme styles them itself.
+_FOLLOWS_WINDOW = ("Toplevel", "Frame")
+
+# Classes that also have a ttk style (TButton, TLabel, ...).
+_TTK_CLASSES = ("Button", "Label", "Frame", "Entry", "Checkbutton", "Radiobutton", "Scale")
+
 
 class ThemeManager:
-    def __init__(self, config_loader: ConfigLoader):
+    """
+    Compiles theme files into per-widget-class options and applies them without rebuilding
+    widgets.
+
+    A compiled theme maps Tk classes to full (lowercase) option names, e.g.
+    {"Button": {"background": "#222", "foreground": "#eee"}}.  Compiling validates the files
+    against their schemas once; the result is cached in memory and on disk keyed by a hash
+    of the files, so unchanged themes skip validation entirely.  apply_theme writes the
+    options into the Tk option database (for widgets created later) and ttk styles, then
+    reconfigures the existing widget tree in a single pass.
+    """
+
+    def __init__(self, config_loader: ConfigLoader, cache_dir: str = "data/cache/themes"):
         self.config_loader = config_loader
-        self.theme = self.config_loader.load_theme()
-        self.app_theme = self.config_loader.load_app_theme()
+        self.cache_dir = cache_dir
+        self._compiled: Dict[str, Dict[str, dict]] = {}  # File hash -> compiled theme
+        self.current: Optional[Dict[str, dict]] = None
+
+    @staticmethod
+    def compile(*sections: dict) -> Dict[str, dict]:
+        """Turn theme file sections into options per Tk widget class."""
+        compiled: Dict[str, dict] = {}
+        for theme in sections:
+            for section, options in theme.items():
+                widget_class = WIDGET_CLASSES.get(section)
+                if widget_class is None or not isinstance(options, dict):
+                    log.warning(f"Unknown theme section '{section}'.  Ignored.")
+                    continue
+                compiled.setdefault(widget_class, {}).update(
+                    {OPTION_NAMES.get(option, option).lower(): value for option, value in options.items()})
+        window = compiled.get("Tk", {})
+        if "background" in window:
+            for widget_class in _FOLLOWS_WINDOW:
+                compiled.setdefault(widget_class, {}).setdefault("background", window["background"])
+        return compiled
+
+    def load(self, theme_file: Optional[str] = None, app_theme_file: Optional[str] = None) -> Dict[str, dict]:
+        """
+        Compiled theme for a pair of theme files (by default, the ones the ConfigLoader was given).
+
+        Args:
+            theme_file (str):       Optional.  Widget theme, e.g. themes.json.
+            app_theme_file (str):   Optional.  Window theme, e.g. app_theme.json.
+
+        Returns:
+            Dict[str, dict]:        Options per Tk widget class.
+        """
+        theme_file = theme_file or self.config_loader.theme_file
+        app_theme_file = app_theme_file or self.config_loader.app_theme_file
+        try:
+            key = hash_bytes(f"{COMPILED_VERSION} {file_hash(theme_file)} {file_hash(app_theme_file)}".encode())
+        except OSError as e:
+            raise ValueError(f"Configuration error in theme files: {e}")
+        if key in self._compiled:
+            return self._compiled[key]
+
+        cache_path = os.path.join(self.cache_dir, f"{key}.json")
+        compiled = None
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "r") as f:
+                    compiled = json.load(f)
+            except json.JSONDecodeError:
+                log.warning(f"Compiled theme '{cache_path}' not properly formatted.  Recompiling.")
+        if compiled is None:
+            loader = ConfigLoader(theme_file, app_theme_file, self.config_loader.menu_file)
+            compiled = self.compile(loader.load_theme(), loader.load_app_theme())
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(cache_path, "w") as f:
+                    json.dump(compiled, f, indent=4)
+            except OSError as e:
+                log.warning(f"Could not cache compiled theme at '{cache_path}': {e}")
+        self._compiled[key] = compiled
+        return compiled
+
+    def apply_theme(self, widget: tk.Misc, compiled: Optional[Dict[str, dict]] = None):
+        """Apply a compiled theme (by default, the configured one) to a window and everything in it."""
+        if compiled is None:
+            compiled = self.current or self.load()
+        self.current = compiled
+
+        for widget_class, options in compiled.items():
+            for option, value in options.items():
+                widget.option_add(f"*{widget_class}.{_DATABASE_NAMES.get(option, option)}", value)
+        style = ttk.Style(widget)
+        for widget_class in _TTK_CLASSES:
+            if widget_class in compiled:
+                style.configure(f"T{widget_class}", **compiled[widget_class])
+
+        # One pass over existing widgets; a widget rejects options its class doesn't have.
+        pending = [widget]
+        while pending:
+            current = pending.pop()
+            pending.extend(current.winfo_children())
+            options = compiled.get(current.winfo_class())
+            if not options:
+                continue
+            try:
+                current.configure(**options)
+            except tk.TclError:
+                for option, value in options.items():
+                    try:
+                        current.configure(**{option: value})
+                    except tk.TclError:
+                        pass
 
-    def apply_theme(self, widget):
-        """Apply theme to a Tkinter widget."""
-        widget.configure(**self.app_theme.get("window", {}))
-        # Add logic to apply widget-specific styles
\ No newline at end of file
+    def switch_theme(self, widget: tk.Misc, theme_file: str, app_theme_file: Optional[str] = None):
+        """Load (or reuse) another theme and re-style the running window without rebuilding it."""
+        self.apply_theme(widget, self.load(theme_file, app_theme_file))
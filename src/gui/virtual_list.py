@@ -0,0 +1,178 @@
+# src/gui/virtual_list.py
+import tkinter as tk
+from abc import ABCMeta, abstractmethod
+from typing import Callable, List, Optional, Sequence, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.virtual_list")
+
+
+class ListDataSource(metaclass=ABCMeta):
+    """
+    Rows for a VirtualList.  Subclasses provide the row count and the cells of one row;
+    rows are only requested while they are on screen.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def row(self, index: int) -> Sequence[str]:
+        pass
+
+
+class SequenceDataSource(ListDataSource):
+    """
+    Data source over a list of items, with a filter.
+
+    Args:
+        items (Sequence):           Items to list, e.g. monster index entries or combatants.
+        columns (Callable):         Turns an item into its row cells.
+    """
+
+    def __init__(self, items: Sequence, columns: Callable[[object], Sequence[str]]) -> None:
+        self.items = items
+        self.columns = columns
+        self._visible: Optional[List[int]] = None  # Item indices passing the filter; None when unfiltered
+
+    def __len__(self) -> int:
+        return len(self.items) if self._visible is None else len(self._visible)
+
+    def item(self, index: int) -> object:
+        return self.items[index if self._visible is None else self._visible[index]]
+
+    def row(self, index: int) -> Sequence[str]:
+        return self.columns(self.item(index))
+
+    def filter(self, predicate: Optional[Callable[[object], bool]]) -> None:
+        """Show only items matching a predicate (None shows everything)."""
+        self._visible = None if predicate is None else [i for i, item in enumerate(self.items) if predicate(item)]
+
+
+class VirtualList(tk.Frame):
+    """
+    Scrolling list/table that only creates enough row widgets to fill its height.
+
+    Rows are a fixed pool of label rows placed at fixed offsets.  Scrolling changes which
+    data row each widget row shows and only reconfigures labels whose text changed, so the
+    cost of scrolling or filtering and the number of widgets don't grow with the list.
+
+    Args:
+        parent (tk.Misc):                   Parent widget.
+        source (ListDataSource):            Rows to show.
+        columns (Sequence[Tuple[str, int]]): Heading and width in characters of each column.
+        row_height (int):                   Row height in pixels.
+        on_select (Callable):               Optional.  Called with the data index of a clicked row.
+        highlight (str):                    Background colour of the selected row.
+    """
+
+    def __init__(self, parent: tk.Misc, source: ListDataSource, columns: Sequence[Tuple[str, int]],
+                 row_height: int = 22, on_select: Optional[Callable[[int], None]] = None,
+                 highlight: str = "#cce0ff", **options) -> None:
+        super().__init__(parent, **options)
+        self.source = source
+        self.columns = list(columns)
+        self.row_height = row_height
+        self.on_select = on_select
+        self.highlight = highlight
+        self.top = 0  # Data index shown in the first row
+        self.selected: Optional[int] = None
+        self._rows: List[Tuple[tk.Frame, List[tk.Label]]] = []
+        self._shown: List[Optional[Tuple]] = []  # Per widget row: (data index, cells, selected) last drawn
+
+        header = tk.Frame(self)
+        header.pack(side=tk.TOP, fill=tk.X)
+        for heading, width in self.columns:
+            tk.Label(header, text=heading, width=width, anchor=tk.W, font=("TkDefaultFont", 9, "bold")).pack(side=tk.LEFT)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.body = tk.Frame(self)
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.body.bind("<Configure>", self._on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.body.bind(sequence, self._on_wheel)
+
+    def _visible_rows(self) -> int:
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def _make_row(self, position: int) -> None:
+        frame = tk.Frame(self.body)
+        frame.place(x=0, y=position * self.row_height, relwidth=1.0, height=self.row_height)
+        labels = []
+        for _, width in self.columns:
+            label = tk.Label(frame, width=width, anchor=tk.W)
+            label.pack(side=tk.LEFT)
+            label.bind("<Button-1>", lambda event, position=position: self._on_click(position))
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                label.bind(sequence, self._on_wheel)
+            labels.append(label)
+        self._rows.append((frame, labels))
+        self._shown.append(None)
+
+    def _on_resize(self, event=None) -> None:
+        needed = self._visible_rows() + 1  # One extra for a partly visible last row
+        while len(self._rows) < needed:
+            self._make_row(len(self._rows))
+        while len(self._rows) > needed:
+            frame, _ = self._rows.pop()
+            self._shown.pop()
+            frame.destroy()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Redraw after scrolling, resizing or a change in the data source."""
+        count = len(self.source)
+        self.top = max(0, min(self.top, count - self._visible_rows()))
+        for position, (frame, labels) in enumerate(self._rows):
+            index = self.top + position
+            if index < count:
+                cells = tuple(self.source.row(index))
+                state = (index, cells, index == self.selected)
+            else:
+                cells, state = (), None
+            if state == self._shown[position]:
+                continue
+            self._shown[position] = state
+            background = self.highlight if state and state[2] else self.body.cget("background")
+            for column, label in enumerate(labels):
+                label.configure(text=cells[column] if column < len(cells) else "", background=background)
+        if count:
+            visible = self._visible_rows()
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + visible) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def reload(self) -> None:
+        """Go back to the top and clear the selection, e.g. after filtering the data source."""
+        self.top = 0
+        self.selected = None
+        self.refresh()
+
+    def scroll_to(self, index: int) -> None:
+        self.top = index
+        self.refresh()
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self.top = int(float(amount) * len(self.source))
+        elif action == "scroll":
+            step = self._visible_rows() if unit == "pages" else 1
+            self.top += int(amount) * step
+        self.refresh()
+
+    def _on_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.top -= 3
+        else:
+            self.top += 3
+        self.refresh()
+
+    def _on_click(self, position: int) -> None:
+        index = self.top + position
+        if index >= len(self.source):
+            return
+        self.selected = index
+        self.refresh()
+        if self.on_select is not None:
+            self.on_select(index)
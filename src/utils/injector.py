@@ -1,31 +1,254 @@
-from src.core.mediator import Mediator
-from src.core.config import ConfigLoader
-from src.gui.app_gui import AppGUI
-from src.gui.theme import ThemeManager
-from src.gui.widgets import WidgetFactory
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.injector")
+
+# Provider scopes.  Session and encounter instances are dropped by end_scope.
+SINGLETON = "singleton"
+SESSION = "session"
+ENCOUNTER = "encounter"
+SCOPES = (SINGLETON, SESSION, ENCOUNTER)  # Longest-lived first
+
+THEME_FILE = "config/themes.json"
+APP_THEME_FILE = "config/app_theme.json"
+MENU_FILE = "config/menu_config.json"
+
+
+def _load(target: str) -> Callable:
+    """'package.module:attribute' -> the attribute, importing the module on first use."""
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class Provider:
+    """
+    How to build one dependency: a factory called with its dependencies, in order.
+    'requires' lists files or directories the factory reads; warm_up skips the provider
+    while any of them is missing.
+    """
+
+    __slots__ = ("name", "factory", "dependencies", "scope", "requires")
+
+    def __init__(self, name: str, factory, dependencies: Sequence[str] = (), scope: str = SINGLETON,
+                 requires: Sequence[str] = ()):
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope '{scope}'.  Expected one of {SCOPES}.")
+        self.name = name
+        self.factory = factory  # Callable, or 'module:attribute' imported when first built
+        self.dependencies = tuple(dependencies)
+        self.scope = scope
+        self.requires = tuple(requires)
+
+    def configured(self) -> bool:
+        return all(os.path.exists(path) for path in self.requires)
+
+
+class LazyProxy:
+    """Stands in for a dependency and builds it on first attribute access."""
+
+    __slots__ = ("_injector", "_name")
+
+    def __init__(self, injector: "Injector", name: str):
+        object.__setattr__(self, "_injector", injector)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._injector.get(self._name), attribute)
+
+    def __setattr__(self, attribute: str, value: Any):
+        setattr(self._injector.get(self._name), attribute, value)
+
+    def __repr__(self) -> str:
+        return f"<LazyProxy {self._name}>"
+
+
+def _mediator(config_loader):
+    mediator = _load("src.core.mediator:Mediator")(config_loader)
+    mediator.register_handler("get_menu_config", config_loader.load_menu_config)
+    return mediator
+
+
+def _default_providers() -> List[Provider]:
+    return [
+        Provider("ConfigLoader", lambda: _load("src.core.config:ConfigLoader")(THEME_FILE, APP_THEME_FILE, MENU_FILE)),
+        Provider("Mediator", _mediator, ["ConfigLoader"]),
+        Provider("ThemeManager", "src.gui.theme:ThemeManager", ["ConfigLoader"]),
+        Provider("CompiledTheme", lambda themes: themes.load(), ["ThemeManager"],
+                 requires=[THEME_FILE, APP_THEME_FILE]),
+        Provider("WidgetFactory", "src.gui.widgets:WidgetFactory", ["Mediator"]),
+        Provider("AppGUI", "src.gui.app_gui:AppGUI", ["Mediator", "ThemeManager", "WidgetFactory"]),
+        Provider("OptionRegistry", "src.utils.dice_options:load_option_handlers",
+                 requires=["data/config/dice_options.json"]),
+        Provider("MonsterIndex", "src.core.designer:load_monster_index", requires=["data/monsters"]),
+    ]
+
 
 class Injector:
-    def __init__(self):
-        self._instances = {}
+    """
+    Registry of providers that builds dependencies on first request.
+
+    Each provider names the dependencies its factory takes, so get builds the dependency
+    graph depth-first and only imports a module when its provider is first used.
+    Singletons live as long as the injector; session and encounter instances are dropped by
+    end_scope; a provider can't depend on one that is dropped sooner than itself, since it
+    would keep the stale instance.  Circular dependencies, declared or through a factory
+    calling get, raise a ValueError rather than deadlocking.  warm_up builds independent providers on a thread pool
+    (e.g. content index, option registry and compiled theme while the window appears).
+    Build times are recorded for timing_report.
+    """
+
+    def __init__(self, providers: Optional[Iterable[Provider]] = None):
+        self._providers: Dict[str, Provider] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._resolving = threading.local()  # Per thread: names being built, outermost first
+        self.timings: Dict[str, dict] = {}  # Name -> ms (own and with dependencies), thread, dependencies
+        for provider in _default_providers() if providers is None else providers:
+            self.register(provider)
+        self.register_instance("Injector", self)
+
+    def register(self, provider: Provider):
+        self._providers[provider.name] = provider
+
+    def register_instance(self, name: str, instance: Any, scope: str = SINGLETON):
+        """Provide an already built object."""
+        self.register(Provider(name, lambda: instance, scope=scope))
+        self._instances[name] = instance
+
+    def _lock(self, name: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(name, threading.Lock())
 
     def get(self, cls):
-        if cls not in self._instances:
-            if cls == ConfigLoader:
-                self._instances[cls] = ConfigLoader(
-                    "config/themes.json",
-                    "config/app_theme.json",
-                    "config/menu_config.json"
-                )
-            elif cls == Mediator:
-                self._instances[cls] = Mediator(self.get(ConfigLoader))
-            elif cls == ThemeManager:
-                self._instances[cls] = ThemeManager(self.get(ConfigLoader))
-            elif cls == WidgetFactory:
-                self._instances[cls] = WidgetFactory(self.get(Mediator))
-            elif cls == AppGUI:
-                self._instances[cls] = AppGUI(
-                    self.get(Mediator),
-                    self.get(ThemeManager),
-                    self.get(WidgetFactory)
-                )
-        return self._instances[cls]
\ No newline at end of file
+        """Instance of a provider, given its class or name; built on first request."""
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name in self._instances:
+            return self._instances[name]
+        provider = self._providers.get(name)
+        if provider is None:
+            raise KeyError(f"Injector has no provider for '{name}'.  Registered: {sorted(self._providers)}.")
+        stack = self._resolution_stack()
+        if name in stack:
+            raise ValueError(f"Circular dependency: {' -> '.join(stack[stack.index(name):] + [name])}.")
+        if not stack:
+            # Locks are taken along dependency edges, so a declared cycle could deadlock two threads.
+            self._check_cycles(name)
+        stack.append(name)
+        try:
+            with self._lock(name):
+                if name in self._instances:  # Built by another thread while waiting
+                    return self._instances[name]
+                for dependency in provider.dependencies:
+                    self._check_scope(provider, dependency)
+                started = time.perf_counter()
+                dependencies = [self.get(dependency) for dependency in provider.dependencies]
+                own_start = time.perf_counter()
+                factory = _load(provider.factory) if isinstance(provider.factory, str) else provider.factory
+                instance = factory(*dependencies)
+                finished = time.perf_counter()
+                self._instances[name] = instance
+                self.timings[name] = {"ms": (finished - own_start) * 1000, "total_ms": (finished - started) * 1000,
+                                      "thread": threading.current_thread().name,
+                                      "dependencies": list(provider.dependencies)}
+        finally:
+            stack.pop()
+        return instance
+
+    def _resolution_stack(self) -> List[str]:
+        stack = getattr(self._resolving, "stack", None)
+        if stack is None:
+            stack = self._resolving.stack = []
+        return stack
+
+    def _check_cycles(self, name: str):
+        """Raise a ValueError if the declared dependencies of 'name' lead back to a provider on the path."""
+        path: List[str] = []
+        done = set()
+
+        def visit(current: str):
+            if current in done:
+                return
+            if current in path:
+                raise ValueError(f"Circular dependency: {' -> '.join(path[path.index(current):] + [current])}.")
+            provider = self._providers.get(current)
+            if provider is None or current in self._instances:
+                return
+            path.append(current)
+            for dependency in provider.dependencies:
+                visit(dependency)
+            path.pop()
+            done.add(current)
+
+        visit(name)
+
+    def _check_scope(self, provider: Provider, dependency: str):
+        needed = self._providers.get(dependency)
+        if needed is not None and SCOPES.index(needed.scope) > SCOPES.index(provider.scope):
+            raise ValueError(f"'{provider.name}' ({provider.scope}) can't depend on '{dependency}' ({needed.scope}): "
+                             f"it would outlive it.")
+
+    def lazy(self, cls) -> LazyProxy:
+        """Proxy that builds the dependency when first used."""
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in self._providers:
+            raise KeyError(f"Injector has no provider for '{name}'.  Registered: {sorted(self._providers)}.")
+        return LazyProxy(self, name)
+
+    def end_scope(self, scope: str):
+        """Drop every instance of a scope, e.g. SESSION when a session is closed."""
+        for name, provider in self._providers.items():
+            if provider.scope == scope:
+                self._instances.pop(name, None)
+                self.timings.pop(name, None)
+
+    def warm_up(self, names: Iterable[str] = ("MonsterIndex", "OptionRegistry", "CompiledTheme"),
+                max_workers: int = 4) -> List[Future]:
+        """
+        Build providers in the background.  Providers whose required files are missing are
+        skipped.  Failures are logged; the provider is simply built (and fails again,
+        visibly) on first real use.
+
+        Returns:
+            List[Future]:   One per provider, resolving to its instance.
+        """
+        def report_failure(future: Future, name: str):
+            if future.exception() is not None:
+                log.warning(f"Warm-up of '{name}' failed: {future.exception()!r}")
+
+        pool = ThreadPoolExecutor(max_workers, thread_name_prefix="warm-up")
+        futures = []
+        for name in names:
+            provider = self._providers.get(name)
+            if provider is not None and not provider.configured():
+                log.debug(f"Warm-up of '{name}' skipped: it needs {list(provider.requires)}.")
+                continue
+            future = pool.submit(self.get, name)
+            future.add_done_callback(lambda done, name=name: report_failure(done, name))
+            futures.append(future)
+        pool.shutdown(wait=False)
+        return futures
+
+    def timing_report(self) -> str:
+        """Build time of every provider built so far, with its dependencies indented below it."""
+        lines = []
+
+        def describe(name: str, depth: int):
+            timing = self.timings.get(name)
+            if timing is None:
+                return
+            lines.append(f"{'  ' * depth}{name}: {timing['ms']:.1f} ms"
+                         f" ({timing['total_ms']:.1f} ms with dependencies, {timing['thread']})")
+            for dependency in timing["dependencies"]:
+                describe(dependency, depth + 1)
+
+        dependents = {dependency for timing in self.timings.values() for dependency in timing["dependencies"]}
+        for name in self.timings:
+            if name not in dependents:
+                describe(name, 0)
+        return "\n".join(lines)
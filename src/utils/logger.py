@@ -2,10 +2,26 @@
 import logging
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 from src.utils.json_cache import JSONCache
+import json
 import os
 
-def setup_logger(name: str, jcache: JSONCache, **kwargs) -> logging.Logger:
+CONFIG_FILE = 'data/config/config.json'
+
+
+@lru_cache(maxsize=None)
+def _default_config() -> Optional[dict]:
+    """config.json, read once for every logger set up without a JSONCache."""
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def setup_logger(name: str, jcache: Optional[JSONCache] = None, **kwargs) -> logging.Logger:
 
     """
     Configure and return a logger instance with a rotating file handler and
@@ -15,7 +31,8 @@ def setup_logger(name: str, jcache: JSONCache, **kwargs) -> logging.Logger:
     Args:
         name:           Logger name. Calls to this method should use '__name__'
                         unless there is a specific reason to use something else.
-        jcache:         Instance of JSONCache to load configuration from.
+        jcache:         Optional instance of JSONCache to load configuration from.
+                        Without one, config.json is read once and shared.
         **kwargs:       Optional keyword arguments to configure the logger.
                         Default values are provided in config file at:
                         data/config/config.json.  If config.json is not found or
@@ -47,7 +64,7 @@ def setup_logger(name: str, jcache: JSONCache, **kwargs) -> logging.Logger:
         Instance of logger
     """
 
-    config_data = jcache.get('data/config/config.json')
+    config_data = jcache.read(CONFIG_FILE) if jcache is not None else _default_config()
     defaults = config_data.get('logger', {}).get('kwargs', {}) if config_data is not None else {}
     software = config_data.get('software', {}).get('name', 'MyApp') if config_data is not None else 'MyApp'
 
@@ -141,12 +158,14 @@ def setup_logger(name: str, jcache: JSONCache, **kwargs) -> logging.Logger:
                                                 defaults.get('log_date_fmt',
                                                     '%Y-%m-%d %H:%M:%S'))
         
-        # Create and configure file handler with rotation
+        # Create and configure file handler with rotation.  The file is only
+        # opened when the first record is written, not at startup.
         log_file = os.path.join(log_dir, f"{file_name}")
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=max_bytes,
-            backupCount=backup_count
+            backupCount=backup_count,
+            delay=True
         )
         file_handler.setLevel(file_log_level)
         file_handler.setFormatter(file_formatter)
@@ -0,0 +1,140 @@
+# src/utils/manifest.py
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.manifest")
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = "data/cache/content_manifest.json"
+DEFAULT_EXCLUDE = ("cache",)  # Derived artifacts live here; they aren't content
+
+
+def hash_bytes(data: bytes) -> str:
+    """BLAKE2b digest of some bytes, as stored in manifests."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_hash(file_path: str) -> str:
+    """BLAKE2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def unchanged(previous: Optional[dict], stat: os.stat_result) -> bool:
+    """True if a manifest entry still matches a file's size and modification time."""
+    return bool(previous) and previous.get("size") == stat.st_size and previous.get("mtime") == stat.st_mtime_ns
+
+
+def file_entry(file_path: str, previous: Optional[dict] = None, stat: Optional[os.stat_result] = None) -> dict:
+    """
+    Size, modification time and hash of a file.  The file is only read if it changed since
+    'previous', its entry in an earlier manifest.
+    """
+    stat = stat or os.stat(file_path)
+    if unchanged(previous, stat) and "hash" in previous:
+        digest = previous["hash"]
+    else:
+        digest = file_hash(file_path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": digest}
+
+
+def ignored_name(name: str) -> bool:
+    """Hidden files and Python build artifacts, which no manifest or outline lists."""
+    return name.startswith(".") or name == "__pycache__" or name.endswith((".pyc", ".pyo"))
+
+
+def _scan(root: str, exclude: Iterable[str] = ()) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Files under a directory as (path relative to root, with '/' separators, entry), in sorted order."""
+    excluded = set(exclude)
+    pending = [("", root)]
+    while pending:
+        relative_dir, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        subdirectories = []
+        for entry in entries:
+            if ignored_name(entry.name):
+                continue
+            relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+            if relative in excluded:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append((relative, entry.path))
+            elif entry.is_file():
+                yield relative, entry
+        pending.extend(reversed(subdirectories))
+
+
+def build_manifest(root: str = "data", previous: Optional[dict] = None,
+                   exclude: Iterable[str] = DEFAULT_EXCLUDE) -> dict:
+    """
+    Record path, size, modification time and content hash of every file under a directory.
+
+    Args:
+        root (str):             Directory to scan.
+        previous (dict):        Optional.  Earlier manifest; files whose size and modification
+                                time are unchanged keep their hash instead of being re-read.
+        exclude (Iterable[str]): Paths relative to root to leave out, with everything under them.
+
+    Returns:
+        dict:                   Manifest with a 'files' entry per relative path.
+    """
+    known = (previous or {}).get("files", {})
+    files: Dict[str, dict] = {}
+    hashed = 0
+    for relative, entry in _scan(root, exclude):
+        stat = entry.stat()
+        old = known.get(relative)
+        hashed += not unchanged(old, stat)
+        files[relative] = file_entry(entry.path, old, stat)
+    log.debug(f"Manifest of '{root}': {len(files)} file(s), {hashed} hashed.")
+    return {"version": MANIFEST_VERSION, "root": root, "files": files}
+
+
+def diff_manifests(old: Optional[dict], new: dict) -> Dict[str, List[str]]:
+    """Relative paths added, changed (different hash) and removed between two manifests."""
+    old_files = (old or {}).get("files", {})
+    new_files = new.get("files", {})
+    return {"added": sorted(path for path in new_files if path not in old_files),
+            "changed": sorted(path for path, details in new_files.items()
+                              if path in old_files and old_files[path]["hash"] != details["hash"]),
+            "removed": sorted(path for path in old_files if path not in new_files)}
+
+
+def load_manifest(manifest_path: str = DEFAULT_MANIFEST) -> Optional[dict]:
+    if not os.path.isfile(manifest_path):
+        return None
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except json.JSONDecodeError:
+        log.warning(f"Manifest '{manifest_path}' not properly formatted.  Rebuilding from scratch.")
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def save_manifest(manifest: dict, manifest_path: str = DEFAULT_MANIFEST) -> None:
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(temp_path, manifest_path)
+
+
+def update_manifest(root: str = "data", manifest_path: str = DEFAULT_MANIFEST,
+                    exclude: Iterable[str] = DEFAULT_EXCLUDE) -> Dict[str, List[str]]:
+    """
+    Rebuild the manifest of a content tree, save it and return what changed since the last one,
+    so derived artifacts (content packs, indexes, validation caches) only rebuild those files.
+    """
+    previous = load_manifest(manifest_path)
+    manifest = build_manifest(root, previous, exclude)
+    changes = diff_manifests(previous, manifest)
+    save_manifest(manifest, manifest_path)
+    return changes
@@ -1,15 +1,37 @@
+import argparse
+import os
 from pathlib import Path
-import json
+from src.utils.manifest import DEFAULT_MANIFEST, ignored_name, update_manifest
+
 
 def generate_pso(project_root: str, output_file: str):
-    root = Path(project_root)
-    with open(output_file, "w") as f:
-        f.write(f"{root.name}/\n")
-        for path in root.rglob("*"):
-            if path.is_dir() and not path.name.startswith("."):
-                f.write(f"{'│   ' * path.relative_to(root).parent.parts.count('/')}{path.name}/\n")
-            elif path.is_file() and not path.name.endswith((".pyc", ".pyo")):
-                f.write(f"{'│   ' * path.relative_to(root).parent.parts.count('/')}{path.name}\n")
+    """Write an indented outline of a project tree."""
+
+    def write(f, directory: str, depth: int):
+        with os.scandir(directory) as entries:
+            entries = sorted((entry for entry in entries if not ignored_name(entry.name)), key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                f.write(f"{'│   ' * depth}{entry.name}/\n")
+                write(f, entry.path, depth + 1)
+            else:
+                f.write(f"{'│   ' * depth}{entry.name}\n")
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(f"{Path(project_root).resolve().name}/\n")
+        write(f, project_root, 0)
+
 
 if __name__ == "__main__":
-    generate_pso(".", "DMBuddyy.txt")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build the content manifest and report what changed.")
+    parser.add_argument("root", nargs="?", default="data")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--outline", help="Also write an outline of the project tree to this file.")
+    args = parser.parse_args()
+    changes = update_manifest(args.root, args.manifest)
+    for kind, paths in changes.items():
+        print(f"{kind}: {len(paths)}")
+        for path in paths:
+            print(f"    {path}")
+    if args.outline:
+        generate_pso(".", args.outline)
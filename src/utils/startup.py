@@ -0,0 +1,62 @@
+# src/utils/startup.py
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+from src.utils.logger import setup_logger
+
+log = setup_logger("DMBuddy.startup")
+
+STARTUP_BUDGET_MS = 1500  # Time to first interactive window before a warning is logged
+
+
+class StartupProfiler:
+    """
+    Records how long each startup phase and deferred import takes.
+
+    Timings are always recorded (they cost a perf_counter call per phase); the report is only
+    printed when 'enabled', e.g. with --profile-startup.  finish logs a warning when startup
+    runs over 'budget_ms', so regressions show up in the log without profiling.
+    """
+
+    def __init__(self, enabled: bool = False, budget_ms: float = STARTUP_BUDGET_MS) -> None:
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.start = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []  # (name, milliseconds), in the order they ended
+        self.total_ms: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - began) * 1000))
+
+    def load(self, module_name: str):
+        """Import a module, timing it as an 'import' phase if it isn't already loaded."""
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        with self.phase(f"import {module_name}"):
+            return importlib.import_module(module_name)
+
+    def finish(self) -> float:
+        """Mark the window as interactive.  Returns total startup time in milliseconds."""
+        self.total_ms = (time.perf_counter() - self.start) * 1000
+        if self.total_ms > self.budget_ms:
+            log.warning(f"Startup took {self.total_ms:.0f} ms, over the {self.budget_ms:.0f} ms budget.")
+        else:
+            log.info(f"Startup took {self.total_ms:.0f} ms.")
+        if self.enabled:
+            print(self.report())
+        return self.total_ms
+
+    def report(self) -> str:
+        width = max((len(name) for name, _ in self.phases), default=5)
+        lines = [f"{'Phase':<{width}}  {'ms':>8}"]
+        lines += [f"{name:<{width}}  {elapsed:8.1f}" for name, elapsed in self.phases]
+        if self.total_ms is not None:
+            lines.append(f"{'Time to interactive':<{width}}  {self.total_ms:8.1f}")
+        return "\n".join(lines)
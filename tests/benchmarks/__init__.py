@@ -0,0 +1,27 @@
+# tests/benchmarks/__init__.py
+from typing import Callable, Dict, Optional
+
+
+class Case:
+    __slots__ = ("name", "setup", "number", "repeat")
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], object]], number: int, repeat: int):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+
+
+CASES: Dict[str, Case] = {}
+
+
+def benchmark(name: Optional[str] = None, number: int = 100, repeat: int = 5):
+    """
+    Register a benchmark.  The decorated function does any setup and returns the callable
+    to time; the callable runs 'number' times per sample, 'repeat' samples.
+    """
+    def decorate(setup):
+        case_name = name or setup.__name__
+        CASES[case_name] = Case(case_name, setup, number, repeat)
+        return setup
+    return decorate
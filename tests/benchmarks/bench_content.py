@@ -0,0 +1,31 @@
+# tests/benchmarks/bench_content.py
+from tests.benchmarks import benchmark
+
+CONFIG_FILE = "data/config/config.json"
+
+
+@benchmark("JSONCache.read cold", number=200)
+def json_read_cold():
+    from src.utils.json_cache import JSONCache
+    jcache = JSONCache(CONFIG_FILE)
+    return lambda: jcache.read(CONFIG_FILE, force_reload=True)
+
+
+@benchmark("JSONCache.read warm", number=5000)
+def json_read_warm():
+    from src.utils.json_cache import JSONCache
+    jcache = JSONCache(CONFIG_FILE)
+    return lambda: jcache.read(CONFIG_FILE)
+
+
+@benchmark("TemplateEngine.render attack line", number=500)
+def template_render():
+    from types import SimpleNamespace
+    from src.utils.string_render import TemplateEngine
+    engine = TemplateEngine()
+    engine.register_handler("attack_bonus", lambda data: 5)
+    template = "{attacker.name|capitalize} attacks {target.name} with {item.name}: {attack_bonus} to hit, {item.damage_dice} damage."
+    data = {"attacker": SimpleNamespace(name="goblin"), "target": SimpleNamespace(name="Aria"),
+            "item": SimpleNamespace(name="scimitar", damage_dice="1d6+2")}
+    return lambda: engine.render(template, data)
+
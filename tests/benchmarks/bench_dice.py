@@ -0,0 +1,35 @@
+# tests/benchmarks/bench_dice.py
+from tests.benchmarks import benchmark
+
+# Damage and hit point expressions as they appear in 5e statblocks.
+STATBLOCK_DICE = ["1d4", "1d6+2", "2d6+3", "1d8+1", "2d8+4", "3d10", "4d6", "8d6", "1d12+5", "2d10+6",
+                  "3d6+3", "6d8+12", "10d10+40", "1d20", "2d4", "4d8+4", "7d8+14", "12d10+36", "1d10 + 3",
+                  "18d10+90"]
+
+
+@benchmark("validate_string statblock corpus", number=20)
+def validate_corpus():
+    from src.core.dice import validate_string
+    from src.utils.dice_options import OptionRegistry
+    registry = OptionRegistry()
+
+    def run():
+        for dice_string in STATBLOCK_DICE:
+            validate_string(dice_string, registry)
+    return run
+
+
+@benchmark("Roller.roll single d20", number=2000)
+def roll_single():
+    from src.core.dice import Roller
+    roller = Roller(seed=1)
+    dice = {"count": 1, "sides": 20, "modifier": 5}
+    return lambda: roller.roll(dice)
+
+
+@benchmark("Roller.roll_batch 1000 x 8d6", number=20)
+def roll_batch():
+    from src.core.dice import Roller
+    roller = Roller(seed=1)
+    dice = {"count": 8, "sides": 6, "modifier": 0}
+    return lambda: roller.roll_batch(dice, 1000)
@@ -0,0 +1,58 @@
+# tests/benchmarks/bench_encounter.py
+import random
+from types import SimpleNamespace
+from tests.benchmarks import benchmark
+
+TURN_EFFECT = {"effect_type": "condition", "duration": "turn_based", "duration_value": 3,
+               "duration_trigger": "end_of_turn", "duration_trigger_source": "effect_target"}
+
+
+def _combatant(name: str) -> SimpleNamespace:
+    # Stand-in with the attributes the encounter and combat code use.
+    return SimpleNamespace(name=name, max_hp=40, current_hp=40, temp_hp=0, initiative_bonus=2,
+                           stats={"dexterity": 14}, saves={}, damage_immunities=[], damage_resistances=[],
+                           damage_vulnerabilities=[])
+
+
+@benchmark("EffectScheduler tick 100 combatants", number=20)
+def effect_ticking():
+    from src.content.effect import Effect
+    from src.core.scheduler import EffectScheduler
+
+    ids = [f"c{i}" for i in range(100)]
+
+    def run():
+        scheduler = EffectScheduler()
+        for combatant_id in ids:
+            for _ in range(3):
+                scheduler.schedule(Effect(combatant_id, dict(TURN_EFFECT, effect_id="bench_hold")), combatant_id)
+        for _ in range(3):
+            for combatant_id in ids:
+                scheduler.begin_turn(combatant_id)
+                scheduler.end_turn(combatant_id)
+    return run
+
+
+@benchmark("Encounter round 100 combatants", number=5)
+def encounter_round():
+    from src.core.combat import apply_damage
+    from src.core.dice import Roller
+    from src.core.encounter import Encounter
+
+    roller = Roller(seed=7)
+    encounter = Encounter(roller)
+    ids = [encounter.add_combatant(_combatant(f"c{i}"), f"c{i}") for i in range(100)]
+    attack = {"count": 1, "sides": 20, "modifier": 4}
+    damage = {"count": 1, "sides": 8, "modifier": 2}
+    pick = random.Random(7)
+
+    def run():
+        for _ in ids:
+            current = encounter.next_turn()
+            target = encounter.combatants[pick.choice(ids)]
+            if roller.roll(attack)[-1] >= 13:
+                with encounter.history.action(f"{current} attacks"):
+                    apply_damage(target, roller.roll(damage)[-1], encounter.history)
+            if target.current_hp <= 0:
+                target.current_hp = target.max_hp
+    return run
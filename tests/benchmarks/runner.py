@@ -0,0 +1,131 @@
+# tests/benchmarks/runner.py
+"""
+Benchmark runner for DM Buddy's hot paths.
+
+Benchmarks live in bench_*.py files next to this one (pytest doesn't collect them).  Each
+is a function decorated with @benchmark that does its setup and returns the callable to
+time.  Results are compared with the JSON baseline committed next to this file
+(baseline.json); the run fails when a benchmark is slower than its baseline by more than
+the threshold, when a benchmark raises, or when there is no baseline to compare with.
+
+Timings depend on the machine, so re-record the baseline on the machine that runs the gate
+(and commit it) after adding a benchmark or a deliberate performance change.
+
+    python -m tests.benchmarks.runner                   # Run and compare with the baseline
+    python -m tests.benchmarks.runner --save-baseline   # Run and record a new baseline
+    python -m tests.benchmarks.runner -k dice --threshold 0.5
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import statistics
+import sys
+import timeit
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional
+from tests.benchmarks import CASES, Case
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25  # Fail when more than 25% slower than the baseline
+
+
+def discover() -> Dict[str, Case]:
+    """Import every bench_*.py module in this package."""
+    package = Path(__file__).resolve().parent
+    for module in pkgutil.iter_modules([str(package)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"tests.benchmarks.{module.name}")
+    return CASES
+
+
+def run_case(case: Case) -> dict:
+    """Time one case.  Errors in setup or in the timed call are caught and reported."""
+    try:
+        # Some hot paths print; keep that cost in the timing but out of the report.
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            target = case.setup()
+            samples = timeit.Timer(target).repeat(case.repeat, case.number)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+    per_call = [sample / case.number for sample in samples]
+    return {"best_us": min(per_call) * 1e6, "median_us": statistics.median(per_call) * 1e6,
+            "number": case.number, "repeat": case.repeat}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Names of benchmarks whose best time regressed beyond the threshold."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("best_us")
+        if before and "best_us" in result and result["best_us"] > before * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run DM Buddy benchmarks and compare with a baseline.")
+    parser.add_argument("-k", dest="keyword", help="Only run benchmarks whose name contains this.")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON file.")
+    parser.add_argument("--threshold", type=float, default=float(os.environ.get("BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+                        help="Allowed slowdown as a fraction of the baseline (default 0.25, or $BENCH_THRESHOLD).")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline.")
+    parser.add_argument("--output", help="Also write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    # Data paths in the code under test are relative to the project root.
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    logging.disable(logging.WARNING)  # Hot paths log; don't time the log handlers
+
+    cases = [case for name, case in sorted(discover().items()) if not args.keyword or args.keyword in name]
+    baseline: Dict[str, dict] = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    elif not args.save_baseline:
+        print(f"No baseline at {args.baseline}.  Record one with --save-baseline.")
+        return 1
+
+    results: Dict[str, dict] = {}
+    width = max((len(case.name) for case in cases), default=10)
+    print(f"{'Benchmark':<{width}}  {'best (us)':>12}  {'median (us)':>12}  {'baseline':>12}  change")
+    for case in cases:
+        result = results[case.name] = run_case(case)
+        if "error" in result:
+            print(f"{case.name:<{width}}  ERROR  {result['error']}")
+            continue
+        before = baseline.get(case.name, {}).get("best_us")
+        change = f"{(result['best_us'] / before - 1) * 100:+.1f}%" if before else "new"
+        shown = f"{before:12.2f}" if before else f"{'-':>12}"
+        print(f"{case.name:<{width}}  {result['best_us']:12.2f}  {result['median_us']:12.2f}  {shown}  {change}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+    errors = [name for name, result in results.items() if "error" in result]
+    if errors:
+        print(f"\n{len(errors)} benchmark(s) could not run: {', '.join(errors)}")
+        return 1
+    if args.save_baseline:
+        baseline.update({name: result for name, result in results.items() if "error" not in result})
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+# tests/test_effect.py
+from src.content import effect
+
+
+def test_load_effect_specs_skips_templates(tmp_path, monkeypatch):
+    monkeypatch.setattr(effect, "_specs", {})
+    monkeypatch.setattr(effect, "_specs_loaded", False)
+    (tmp_path / "effect_template.json").write_text('{"template_effect": {"effect_type": "condition"}}')
+    (tmp_path / "conditions.json").write_text('{"prone": {"effect_type": "condition"}}')
+
+    specs = effect.load_effect_specs(str(tmp_path))
+
+    assert "prone" in specs
+    assert "template_effect" not in specs
@@ -0,0 +1,30 @@
+# tests/test_history.py
+from src.content.derived import DerivedStats
+from src.core.history import History
+
+
+class _Stats:
+    """Minimal owner of derived stats: armor class read from base_ac."""
+
+    def __init__(self):
+        self.base_ac = 12
+        self.derived = DerivedStats()
+
+    def armor_class(self):
+        def compute():
+            self.derived.depends_on(("base_ac",))
+            return self.base_ac
+        return self.derived.get(("armor_class",), compute)
+
+
+def test_undo_and_redo_invalidate_derived_stats():
+    history = History()
+    owner = _Stats()
+    assert owner.armor_class() == 12
+
+    history.set_attr(owner, "base_ac", 16)
+    assert owner.armor_class() == 16
+    history.undo()
+    assert owner.armor_class() == 12
+    history.redo()
+    assert owner.armor_class() == 16
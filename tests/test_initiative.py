@@ -0,0 +1,74 @@
+# tests/test_initiative.py
+from src.core.encounter import Encounter
+from src.core.initiative import InitiativeTracker
+
+
+class FixedRoller:
+    """Rolls each combatant's initiative from a list, in the order they are added."""
+
+    def __init__(self, totals):
+        self.totals = list(totals)
+
+    def roll(self, dice):
+        return [self.totals.pop(0)]
+
+
+def _tracker():
+    tracker = InitiativeTracker()
+    for combatant_id, initiative in (("A", 20), ("B", 15), ("C", 10)):
+        tracker.add(combatant_id, initiative)
+    return tracker
+
+
+def test_removing_acting_combatant_vacates_turn():
+    tracker = _tracker()
+    tracker.next_turn()
+    assert tracker.next_turn() == "B"
+    tracker.remove("B")
+    assert tracker.current() is None
+    assert tracker.peek_next() == "C"
+    assert tracker.next_turn() == "C"
+    assert tracker.round == 1
+
+
+def test_removing_last_acting_combatant_wraps_round():
+    tracker = _tracker()
+    for _ in range(3):
+        tracker.next_turn()
+    tracker.remove("C")
+    assert tracker.next_turn() == "A"
+    assert tracker.round == 2
+
+
+def test_delay_and_resume():
+    tracker = _tracker()
+    tracker.next_turn()
+    tracker.next_turn()
+    assert tracker.delay()
+    assert tracker.current() is None
+    assert tracker.next_turn() == "C"
+    assert tracker.resume("B")
+    assert tracker.order() == ["A", "C", "B"]
+    assert tracker.next_turn() == "B"
+    assert tracker.next_turn() == "A"
+    assert tracker.round == 2
+
+
+def test_encounter_does_not_end_vacated_turn_twice():
+    encounter = Encounter(FixedRoller([20, 15, 10]))
+    for combatant_id in ("A", "B", "C"):
+        encounter.add_combatant(object(), combatant_id)
+    ended = []
+    end_turn = encounter.effect_scheduler.end_turn
+    encounter.effect_scheduler.end_turn = lambda owner: ended.append(owner) or end_turn(owner)
+
+    assert encounter.next_turn() == "A"
+    assert encounter.next_turn() == "B"
+    encounter.initiative.delay()
+    assert encounter.next_turn() == "C"
+    encounter.remove_combatant("C")
+    assert encounter.next_turn() == "A"
+    assert ended == ["A"]  # Neither B (delayed) nor C (removed) had their turn ended a second time
+    encounter.initiative.resume("B")
+    assert encounter.next_turn() == "B"
+    assert ended == ["A", "A"]
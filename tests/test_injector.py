@@ -0,0 +1,25 @@
+# tests/test_injector.py
+import pytest
+from src.utils.injector import Injector, Provider
+
+
+def test_declared_cycle_raises():
+    injector = Injector([Provider("A", lambda b: "a", ["B"]), Provider("B", lambda a: "b", ["A"])])
+    with pytest.raises(ValueError, match="A -> B -> A"):
+        injector.get("A")
+
+
+def test_factory_resolving_itself_raises():
+    injector = Injector([])
+    injector.register(Provider("Loop", lambda injector: injector.get("Loop"), ["Injector"]))
+    with pytest.raises(ValueError, match="Loop -> Loop"):
+        injector.get("Loop")
+
+
+def test_dependencies_are_built_once():
+    built = []
+    injector = Injector([Provider("Config", lambda: built.append("Config") or "config"),
+                         Provider("Theme", lambda config: f"theme({config})", ["Config"]),
+                         Provider("App", lambda config, theme: (config, theme), ["Config", "Theme"])])
+    assert injector.get("App") == ("config", "theme(config)")
+    assert built == ["Config"]
@@ -0,0 +1,56 @@
+# tests/test_inventory.py
+from src.content.inventory import ROOT, Inventory
+from src.content.item import Item
+
+
+def _item(name, weight, capacity=0.0, weightless_contents=False):
+    return Item({"name": name, "weight": weight, "capacity": capacity,
+                 "weightless_contents": weightless_contents})
+
+
+def test_full_bag_does_not_fit_in_small_pouch():
+    inventory = Inventory()
+    pouch = _item("Pouch", 1, capacity=5)
+    bag = _item("Bag", 1, capacity=10)
+    inventory.add(pouch)
+    inventory.add(bag)
+    assert inventory.add(_item("Rope", 8), bag.item_ID)
+
+    assert not inventory.can_put_in_container(bag.item_ID, pouch.item_ID)
+    assert not inventory.move(bag.item_ID, pouch.item_ID)
+    assert inventory.container_of(bag.item_ID) == ROOT
+
+
+def test_adding_to_nested_container_checks_enclosing_containers():
+    inventory = Inventory()
+    pouch = _item("Pouch", 1, capacity=5)
+    bag = _item("Bag", 1, capacity=10)
+    inventory.add(pouch)
+    inventory.add(bag, pouch.item_ID)
+
+    assert not inventory.add(_item("Rope", 8), bag.item_ID)
+    assert inventory.add(_item("Candle", 4), bag.item_ID)
+    assert inventory.container_totals(pouch.item_ID)["weight"] == 5
+
+
+def test_moving_within_the_same_container_chain():
+    inventory = Inventory()
+    backpack = _item("Backpack", 5, capacity=10)
+    bag = _item("Bag", 1, capacity=10)
+    rope = _item("Rope", 8)
+    inventory.add(backpack)
+    inventory.add(bag, backpack.item_ID)
+    inventory.add(rope, bag.item_ID)
+
+    # The rope already counts against the backpack, so lifting it out of the bag still fits.
+    assert inventory.move(rope.item_ID, backpack.item_ID)
+
+
+def test_weightless_container_stops_the_check():
+    inventory = Inventory()
+    pouch = _item("Pouch", 1, capacity=5)
+    holding = _item("Bag of Holding", 3, capacity=500, weightless_contents=True)
+    inventory.add(pouch)
+    inventory.add(holding, pouch.item_ID)
+
+    assert inventory.add(_item("Anvil", 100), holding.item_ID)
@@ -0,0 +1,31 @@
+# tests/test_journal.py
+from types import SimpleNamespace
+from src.core.combat import apply_damage
+from src.core.encounter import Encounter
+from src.core.journal import Journal
+from tests.test_initiative import FixedRoller
+
+
+def test_record_opens_the_journal(tmp_path):
+    journal = Journal(str(tmp_path / "session"))
+    journal.record("set", ["round"], 1)
+    journal.close()
+
+    assert Journal(str(tmp_path / "session")).open() == {"round": 1}
+
+
+def test_encounter_changes_are_journaled(tmp_path):
+    journal = Journal(str(tmp_path / "encounter"))
+    journal.open()
+    encounter = Encounter(FixedRoller([12]), journal=journal)
+    goblin = SimpleNamespace(name="Goblin", max_hp=7, current_hp=7, temp_hp=0, initiative_bonus=2,
+                             damage_immunities=[], damage_resistances=[], damage_vulnerabilities=[])
+    encounter.add_combatant(goblin, "g1")
+
+    with encounter.history.action("hit"):
+        apply_damage(goblin, 5, encounter.history)
+    assert Journal(str(tmp_path / "encounter")).open() == {"combatants": {"g1": {"current_hp": 2}}}
+
+    encounter.history.undo()
+    journal.close()
+    assert Journal(str(tmp_path / "encounter")).open() == {"combatants": {"g1": {"current_hp": 7}}}
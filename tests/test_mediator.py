@@ -0,0 +1,24 @@
+# tests/test_mediator.py
+import threading
+from src.core.mediator import Mediator
+
+
+def test_metrics_count_every_dispatch_across_threads():
+    mediator = Mediator(None)
+    mediator.register_handler("ping", lambda: None)
+
+    def dispatch():
+        for _ in range(2000):
+            mediator.notify("ping")
+
+    threads = [threading.Thread(target=dispatch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    futures = [mediator.post_async("ping") for _ in range(100)]
+    for future in futures:
+        future.result()
+    mediator.close()
+
+    assert mediator.metrics()["ping"]["count"] == 8100